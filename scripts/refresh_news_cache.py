@@ -6,27 +6,37 @@ Run this script once or a few times per day (e.g. via cron):
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 
 from ohmygold.config.settings import get_settings
-from ohmygold.services.news_ingest import collect_news_articles
-from ohmygold.services.sentiment import collect_sentiment_snapshot
+from ohmygold.services.news_ingest import collect_news_articles_async
+from ohmygold.services.sentiment import collect_sentiment_snapshot_async
+
+
+async def _refresh(symbol: str, news_api_key: str | None, alpha_vantage_api_key: str | None):
+    # Both collectors are network-bound and independent, so overlap them.
+    return await asyncio.gather(
+        collect_news_articles_async(
+            symbol,
+            news_api_key=news_api_key,
+            alpha_vantage_api_key=alpha_vantage_api_key,
+            limit=50,
+        ),
+        collect_sentiment_snapshot_async(
+            symbol,
+            news_api_key=news_api_key,
+            alpha_vantage_api_key=alpha_vantage_api_key,
+        ),
+    )
 
 
 def main() -> None:
     settings = get_settings()
     symbol = settings.default_symbol
 
-    articles = collect_news_articles(
-        symbol,
-        news_api_key=settings.news_api_key,
-        alpha_vantage_api_key=settings.alpha_vantage_api_key,
-        limit=50,
-    )
-    sentiment = collect_sentiment_snapshot(
-        symbol,
-        news_api_key=settings.news_api_key,
-        alpha_vantage_api_key=settings.alpha_vantage_api_key,
+    articles, sentiment = asyncio.run(
+        _refresh(symbol, settings.news_api_key, settings.alpha_vantage_api_key)
     )
 
     print(f"Cached {len(articles)} articles for {symbol}.")
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import copy
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from ..compat import AssistantAgent, LocalCommandLineCodeExecutor, UserProxyAgent
 from ..config.settings import Settings, get_settings
@@ -19,7 +21,7 @@ _GLOBAL_JSON_CONTRACT = (
 
 
 def _should_enable_code_execution(settings: Settings, agent_name: str) -> bool:
-    return settings.code_execution_enabled and agent_name in set(settings.code_execution_agents)
+    return settings.code_execution_enabled and agent_name in settings.code_execution_agents
 
 
 def _build_code_execution_config(settings: Settings, agent_name: str) -> Dict[str, Any] | None:
@@ -38,37 +40,59 @@ def _build_code_execution_config(settings: Settings, agent_name: str) -> Dict[st
     }
 
 
-def build_llm_config(settings: Settings, *, agent_name: str) -> Dict[str, Any]:
-    """Return the AutoGen llm_config dictionary with optional local overrides."""
-
+@lru_cache(maxsize=32)
+def _cached_llm_config(
+    local_model_name: Optional[str],
+    local_model_base_url: Optional[str],
+    local_model_api_key: Optional[str],
+    deepseek_model: str,
+    deepseek_api_key: Optional[str],
+    deepseek_base_url: Optional[str],
+) -> Dict[str, Any]:
     config_list: List[Dict[str, Any]] = []
-    local_agents = set(settings.local_model_agents)
 
-    if (
-        settings.local_model_enabled
-        and settings.local_model_name
-        and agent_name in local_agents
-    ):
+    if local_model_name:
         local_config: Dict[str, Any] = {
-            "model": settings.local_model_name,
+            "model": local_model_name,
         }
-        if settings.local_model_base_url:
-            local_config["base_url"] = settings.local_model_base_url
-        if settings.local_model_api_key:
-            local_config["api_key"] = settings.local_model_api_key
+        if local_model_base_url:
+            local_config["base_url"] = local_model_base_url
+        if local_model_api_key:
+            local_config["api_key"] = local_model_api_key
         config_list.append(local_config)
 
     config_list.append(
         {
-            "model": settings.deepseek_model,
-            "api_key": settings.deepseek_api_key,
-            "base_url": settings.deepseek_base_url,
+            "model": deepseek_model,
+            "api_key": deepseek_api_key,
+            "base_url": deepseek_base_url,
         }
     )
 
     return {"config_list": config_list}
 
 
+def build_llm_config(settings: Settings, *, agent_name: str) -> Dict[str, Any]:
+    """Return the AutoGen llm_config dictionary with optional local overrides."""
+
+    use_local = bool(
+        settings.local_model_enabled
+        and settings.local_model_name
+        and agent_name in settings.local_model_agents
+    )
+    # The config only depends on these field values, so agents sharing a
+    # backend reuse one cached build; hand out a copy so callers may mutate it.
+    cached = _cached_llm_config(
+        settings.local_model_name if use_local else None,
+        settings.local_model_base_url if use_local else None,
+        settings.local_model_api_key if use_local else None,
+        settings.deepseek_model,
+        settings.deepseek_api_key,
+        settings.deepseek_base_url,
+    )
+    return copy.deepcopy(cached)
+
+
 def create_llm_agent(name: str, system_prompt: str, settings: Settings | None = None) -> AssistantAgent:
     """Create an AutoGen AssistantAgent with optional local execution support."""
 
@@ -80,11 +104,9 @@ def create_llm_agent(name: str, system_prompt: str, settings: Settings | None =
     if effective_settings.deepseek_base_url and not os.environ.get("OPENAI_BASE_URL"):
         os.environ["OPENAI_BASE_URL"] = effective_settings.deepseek_base_url
 
-    system_message = system_prompt + _GLOBAL_JSON_CONTRACT
-
     return AssistantAgent(
         name=name,
-        system_message=system_message,
+        system_message=system_prompt + _GLOBAL_JSON_CONTRACT,
         llm_config=build_llm_config(effective_settings, agent_name=name),
         code_execution_config=code_execution_config or False,
     )
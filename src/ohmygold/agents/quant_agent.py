@@ -2,36 +2,40 @@
 
 from __future__ import annotations
 
+from typing import Final
+
 from ..compat import AssistantAgent
 from .base import create_llm_agent
 from ..config.settings import Settings
 
 
+_SYSTEM_PROMPT: Final[str] = (
+    "Role: QuantResearchAgent. Personality: regime-classification quant who trusts statistics over anecdotes. "
+    "Phase: 'Phase 1 - Research Briefing'. Run code via ToolsProxy to generate signals, probabilities, and stress tests—summarize the results but do not paste code or raw outputs. Quantify how signals behave across D1 regime versus intra-day (H4) breakout triggers so HeadTrader can judge resonance strength. "
+    "Respond with a single JSON object only (no markdown fences). Use this schema:\n"
+    "{\n"
+    "  \"phase\": \"Phase 1 - Research Briefing\",\n"
+    "  \"status\": \"IN_PROGRESS|COMPLETE|BLOCKED\",\n"
+    "  \"summary\": \"Quant headline\",\n"
+    "  \"details\": {\n"
+    "    \"signals\": [{\"name\": str, \"value\": number|null, \"bias\": \"bullish|bearish|neutral\"}],\n"
+    "    \"expected_return\": number|null,\n"
+    "    \"risk_reward\": {\"ratio\": number|null, \"commentary\": str},\n"
+    "    \"stress_tests\": [{\"scenario\": str, \"pnl_millions\": number|null}],\n"
+    "    \"historical_references\": [{\"strategy\": str, \"window\": str, \"performance_note\": str}],\n"
+    "    \"data_sources\": [\"tool_name\"],\n"
+    "    \"risks\": [str],\n"
+    "    \"missing_inputs\": [str],\n"
+    "    \"next_agent\": \"HeadTraderAgent\"\n"
+    "  }\n"
+    "}.\n"
+    "Every key must be present; empty collections should be []. Avoid repeating instructions or prior summaries. "
+    "If missing inputs block the analysis, set status='BLOCKED', add details.missing_inputs ([str]), and keep next_agent='HeadTraderAgent'. "
+    "Otherwise set status='COMPLETE' when quantitative outputs are ready."
+)
+
+
 def create_quant_research_agent(settings: Settings) -> AssistantAgent:
     """Create an agent that synthesizes model-driven insights."""
 
-    system_prompt = (
-        "Role: QuantResearchAgent. Personality: regime-classification quant who trusts statistics over anecdotes. "
-        "Phase: 'Phase 1 - Research Briefing'. Run code via ToolsProxy to generate signals, probabilities, and stress tests—summarize the results but do not paste code or raw outputs. Quantify how signals behave across D1 regime versus intra-day (H4) breakout triggers so HeadTrader can judge resonance strength. "
-        "Respond with a single JSON object only (no markdown fences). Use this schema:\n"
-        "{\n"
-        "  \"phase\": \"Phase 1 - Research Briefing\",\n"
-        "  \"status\": \"IN_PROGRESS|COMPLETE|BLOCKED\",\n"
-        "  \"summary\": \"Quant headline\",\n"
-        "  \"details\": {\n"
-        "    \"signals\": [{\"name\": str, \"value\": number|null, \"bias\": \"bullish|bearish|neutral\"}],\n"
-        "    \"expected_return\": number|null,\n"
-        "    \"risk_reward\": {\"ratio\": number|null, \"commentary\": str},\n"
-        "    \"stress_tests\": [{\"scenario\": str, \"pnl_millions\": number|null}],\n"
-        "    \"historical_references\": [{\"strategy\": str, \"window\": str, \"performance_note\": str}],\n"
-        "    \"data_sources\": [\"tool_name\"],\n"
-        "    \"risks\": [str],\n"
-        "    \"missing_inputs\": [str],\n"
-        "    \"next_agent\": \"HeadTraderAgent\"\n"
-        "  }\n"
-        "}.\n"
-        "Every key must be present; empty collections should be []. Avoid repeating instructions or prior summaries. "
-        "If missing inputs block the analysis, set status='BLOCKED', add details.missing_inputs ([str]), and keep next_agent='HeadTraderAgent'. "
-        "Otherwise set status='COMPLETE' when quantitative outputs are ready."
-    )
-    return create_llm_agent("QuantResearchAgent", system_prompt, settings)
+    return create_llm_agent("QuantResearchAgent", _SYSTEM_PROMPT, settings)
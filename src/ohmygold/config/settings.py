@@ -10,6 +10,11 @@ from typing import Any, Dict, List
 
 from dotenv import dotenv_values, load_dotenv
 
+try:  # pragma: no cover - optional accelerated JSON decoder
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 # Load environment variables from .env file into os.environ
 load_dotenv()
 
@@ -39,8 +44,10 @@ def _lenient_json_loads(value: str) -> Any:
     """Parse JSON values for settings while tolerating plain strings."""
 
     try:
+        if orjson is not None:
+            return orjson.loads(value)
         return json.loads(value)
-    except json.JSONDecodeError:
+    except ValueError:
         return value
 
 
@@ -131,6 +138,7 @@ class Settings(BaseSettings):
     market_data_cache_minutes: int = Field(10)
     market_data_retry_total: int = Field(4)
     market_data_retry_backoff: float = Field(1.0)
+    market_data_precision: str = Field("float64")
     news_watcher_enabled: bool = Field(False)
     news_watcher_poll_seconds: int = Field(300)
     news_watcher_keywords: List[str] = Field(default_factory=lambda: ["war", "fed", "cpi", "rate", "hike"])
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+import math
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+import numpy as np
 
 from ..config.settings import Settings, get_settings
 from ..services.risk import RiskLimits
@@ -12,17 +16,46 @@ from ..utils.logging import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass(frozen=True)
+# Token universes up to this size are encoded as single-integer bitmasks.
+_BITMASK_MAX_TOKENS = 64
+
+
+@dataclass(frozen=True, slots=True)
+class TokenBitmask:
+    """Allow/deny membership for a small token universe packed into integers."""
+
+    bits: Mapping[str, int] = field(compare=False)
+    allowed_mask: int
+    restricted_mask: int
+
+    @classmethod
+    def build(cls, allowed: FrozenSet[str], restricted: FrozenSet[str]) -> Optional["TokenBitmask"]:
+        universe = sorted(allowed | restricted)
+        if len(universe) > _BITMASK_MAX_TOKENS:
+            return None
+        bits = {token: 1 << offset for offset, token in enumerate(universe)}
+        allowed_mask = 0
+        for token in allowed:
+            allowed_mask |= bits[token]
+        restricted_mask = 0
+        for token in restricted:
+            restricted_mask |= bits[token]
+        return cls(bits=bits, allowed_mask=allowed_mask, restricted_mask=restricted_mask)
+
+
+@dataclass(frozen=True, slots=True)
 class ComplianceConfig:
     """Configuration backing the compliance rule checks."""
 
-    allowed_instruments: Sequence[str]
-    restricted_instruments: Sequence[str]
-    allowed_counterparties: Sequence[str]
-    restricted_counterparties: Sequence[str]
+    allowed_instruments: FrozenSet[str]
+    restricted_instruments: FrozenSet[str]
+    allowed_counterparties: FrozenSet[str]
+    restricted_counterparties: FrozenSet[str]
     max_single_order_oz: float
     require_stop_loss: bool
     require_take_profit: bool
+    instrument_bitmask: Optional[TokenBitmask] = None
+    counterparty_bitmask: Optional[TokenBitmask] = None
 
 
 def _normalise_token(value: Any) -> str:
@@ -45,123 +78,217 @@ def _extract_orders(plan: Mapping[str, Any]) -> List[Mapping[str, Any]]:
     return []
 
 
-def build_compliance_config(settings: Settings) -> ComplianceConfig:
-    """Construct a compliance configuration from application settings."""
-
-    allowed_instruments = tuple(_normalise_token(item) for item in settings.compliance_allowed_instruments)
-    restricted_instruments = tuple(_normalise_token(item) for item in settings.compliance_restricted_instruments)
-    allowed_counterparties = tuple(_normalise_token(item) for item in settings.compliance_allowed_counterparties)
-    restricted_counterparties = tuple(_normalise_token(item) for item in settings.compliance_restricted_counterparties)
-
+def _token_set(values: Tuple[str, ...]) -> FrozenSet[str]:
+    # Settings already validates these as strings, so skip the per-item
+    # ``_normalise_token`` guard; blank entries never match an order token.
+    return frozenset([value.strip().upper() for value in values]) - {""}
+
+
+@lru_cache(maxsize=8)
+def _cached_compliance_config(
+    allowed_instruments: Tuple[str, ...],
+    restricted_instruments: Tuple[str, ...],
+    allowed_counterparties: Tuple[str, ...],
+    restricted_counterparties: Tuple[str, ...],
+    max_single_order_oz: float,
+    require_stop_loss: bool,
+    require_take_profit: bool,
+) -> ComplianceConfig:
+    allowed_instrument_set = _token_set(allowed_instruments)
+    restricted_instrument_set = _token_set(restricted_instruments)
+    allowed_counterparty_set = _token_set(allowed_counterparties)
+    restricted_counterparty_set = _token_set(restricted_counterparties)
     return ComplianceConfig(
-        allowed_instruments=allowed_instruments,
-        restricted_instruments=restricted_instruments,
-        allowed_counterparties=allowed_counterparties,
-        restricted_counterparties=restricted_counterparties,
-        max_single_order_oz=float(settings.compliance_max_single_order_oz),
-        require_stop_loss=bool(settings.compliance_require_stop_loss),
-        require_take_profit=bool(settings.compliance_require_take_profit),
+        allowed_instruments=allowed_instrument_set,
+        restricted_instruments=restricted_instrument_set,
+        allowed_counterparties=allowed_counterparty_set,
+        restricted_counterparties=restricted_counterparty_set,
+        max_single_order_oz=max_single_order_oz,
+        require_stop_loss=require_stop_loss,
+        require_take_profit=require_take_profit,
+        instrument_bitmask=TokenBitmask.build(allowed_instrument_set, restricted_instrument_set),
+        counterparty_bitmask=TokenBitmask.build(allowed_counterparty_set, restricted_counterparty_set),
     )
 
 
-def evaluate_compliance(
-    plan: Mapping[str, Any],
-    *,
-    current_position_oz: float = 0.0,
-    limits: Optional[RiskLimits] = None,
-    settings: Optional[Settings] = None,
-) -> Dict[str, Any]:
-    """Evaluate a trade plan against compliance guardrails."""
-
-    effective_settings = settings or get_settings()
-    config = build_compliance_config(effective_settings)
-    risk_limits = limits or RiskLimits(
-        max_position_oz=effective_settings.max_position_oz,
-        stress_var_millions=effective_settings.stress_var_millions,
-        daily_drawdown_pct=effective_settings.daily_drawdown_pct,
+def build_compliance_config(settings: Settings) -> ComplianceConfig:
+    """Construct a compliance configuration from application settings.
+
+    Results are cached on the relevant setting values, so repeated
+    evaluations against the same settings skip token normalisation.
+    """
+
+    return _cached_compliance_config(
+        tuple(settings.compliance_allowed_instruments),
+        tuple(settings.compliance_restricted_instruments),
+        tuple(settings.compliance_allowed_counterparties),
+        tuple(settings.compliance_restricted_counterparties),
+        float(settings.compliance_max_single_order_oz),
+        bool(settings.compliance_require_stop_loss),
+        bool(settings.compliance_require_take_profit),
     )
 
-    orders = _extract_orders(plan)
-    violations: List[str] = []
-    warnings: List[str] = []
-    order_reports: List[Dict[str, Any]] = []
 
-    net_exposure = 0.0
+def _parse_size(size_raw: Any) -> Optional[float]:
+    size_oz: Optional[float] = None
+    if isinstance(size_raw, (int, float)):
+        size_oz = float(size_raw)
+    elif isinstance(size_raw, str):
+        cleaned = size_raw.strip()
+        if cleaned:
+            try:
+                size_oz = float(cleaned)
+            except ValueError:
+                size_oz = None
+    if size_oz is not None and math.isnan(size_oz):
+        return None
+    return size_oz
+
+
+def _membership_flags(
+    token: str,
+    allowed: FrozenSet[str],
+    restricted: FrozenSet[str],
+    bitmask: Optional[TokenBitmask],
+) -> Tuple[bool, bool]:
+    """Return ``(not_approved, restricted)`` for a normalised token."""
+
+    if not token:
+        return False, False
+    if bitmask is not None:
+        bit = bitmask.bits.get(token, 0)
+        return bool(allowed) and not bit & bitmask.allowed_mask, bool(bit & bitmask.restricted_mask)
+    return bool(allowed) and token not in allowed, token in restricted
+
+
+def _evaluate_orders(
+    orders: Sequence[Mapping[str, Any]],
+    config: ComplianceConfig,
+    risk_limits: RiskLimits,
+) -> Tuple[List[Dict[str, Any]], Set[str], Set[str], float]:
+    violations: Set[str] = set()
+    warnings: Set[str] = set()
+    order_reports: List[Dict[str, Any]] = []
 
-    for index, order in enumerate(orders):
+    # Bind config fields to locals once rather than re-reading them per order.
+    allowed_instruments = config.allowed_instruments
+    restricted_instruments = config.restricted_instruments
+    instrument_bitmask = config.instrument_bitmask
+    allowed_counterparties = config.allowed_counterparties
+    restricted_counterparties = config.restricted_counterparties
+    counterparty_bitmask = config.counterparty_bitmask
+    require_stop_loss = config.require_stop_loss
+    require_take_profit = config.require_take_profit
+
+    # Size and limit arithmetic runs column-wise; NaN marks unparseable sizes.
+    count = len(orders)
+    sides = [str(order.get("side", "")).strip().lower() for order in orders]
+    parsed_sizes = (_parse_size(order.get("size_oz")) for order in orders)
+    sizes = np.fromiter(
+        (math.nan if size_oz is None else size_oz for size_oz in parsed_sizes),
+        dtype=np.float64,
+        count=count,
+    )
+    is_buy = np.fromiter((side == "buy" for side in sides), dtype=bool, count=count)
+    valid_side = is_buy | np.fromiter((side == "sell" for side in sides), dtype=bool, count=count)
+    size_missing = np.isnan(sizes)
+    invalid_size = size_missing | (sizes <= 0)
+    exceeds_single = ~invalid_size & (sizes > config.max_single_order_oz)
+    exceeds_position = ~invalid_size & (sizes > risk_limits.max_position_oz)
+    contributes = valid_side & ~size_missing & (sizes != 0)
+    signed = np.where(is_buy, sizes, -sizes)[contributes]
+    # Sum sequentially so the total matches order-by-order accumulation exactly.
+    net_exposure = sum(signed.tolist(), 0.0)
+
+    size_values = sizes.tolist()
+    size_flags = zip(invalid_size.tolist(), exceeds_single.tolist(), exceeds_position.tolist(), valid_side.tolist())
+    for index, (order, side, size_oz, flags) in enumerate(zip(orders, sides, size_values, size_flags)):
+        order_invalid_size, order_exceeds_single, order_exceeds_position, order_valid_side = flags
         instrument = _normalise_token(order.get("instrument"))
-        side = str(order.get("side", "")).strip().lower()
         counterparty = _normalise_token(order.get("counterparty"))
-        size_raw = order.get("size_oz")
-        size_oz: Optional[float] = None
-        if isinstance(size_raw, (int, float)):
-            size_oz = float(size_raw)
-        elif isinstance(size_raw, str):
-            cleaned = size_raw.strip()
-            if cleaned:
-                try:
-                    size_oz = float(cleaned)
-                except ValueError:
-                    size_oz = None
 
         order_violations: List[str] = []
         order_warnings: List[str] = []
 
-        if config.allowed_instruments and instrument and instrument not in config.allowed_instruments:
+        instrument_not_approved, instrument_restricted = _membership_flags(
+            instrument, allowed_instruments, restricted_instruments, instrument_bitmask
+        )
+        if instrument_not_approved:
             order_violations.append("instrument_not_approved")
-        if instrument and instrument in config.restricted_instruments:
+        if instrument_restricted:
             order_violations.append("instrument_restricted")
 
-        if side not in {"buy", "sell"}:
+        if not order_valid_side:
             order_violations.append("invalid_side")
 
-        if size_oz is None or size_oz <= 0:
+        if order_invalid_size:
             order_violations.append("invalid_size_oz")
-        else:
-            if size_oz > config.max_single_order_oz:
-                order_violations.append("exceeds_single_order_limit")
-            if size_oz > risk_limits.max_position_oz:
-                order_violations.append("exceeds_position_limit")
+        if order_exceeds_single:
+            order_violations.append("exceeds_single_order_limit")
+        if order_exceeds_position:
+            order_violations.append("exceeds_position_limit")
 
-        if config.require_stop_loss and not order.get("stop"):
+        if require_stop_loss and not order.get("stop"):
             order_violations.append("missing_stop_loss")
-        if config.require_take_profit and not order.get("target"):
+        if require_take_profit and not order.get("target"):
             order_warnings.append("missing_take_profit")
 
-        if config.allowed_counterparties and counterparty and counterparty not in config.allowed_counterparties:
+        counterparty_not_approved, counterparty_restricted = _membership_flags(
+            counterparty, allowed_counterparties, restricted_counterparties, counterparty_bitmask
+        )
+        if counterparty_not_approved:
             order_violations.append("counterparty_not_approved")
-        if counterparty and counterparty in config.restricted_counterparties:
+        if counterparty_restricted:
             order_violations.append("counterparty_restricted")
 
-        if size_oz and side in {"buy", "sell"}:
-            direction = 1.0 if side == "buy" else -1.0
-            net_exposure += direction * size_oz
-
         report = {
             "index": index,
             "instrument": instrument or order.get("instrument"),
             "side": side,
-            "size_oz": size_oz,
+            "size_oz": None if size_oz != size_oz else size_oz,
             "counterparty": counterparty or order.get("counterparty"),
             "violations": order_violations,
             "warnings": order_warnings,
         }
         order_reports.append(report)
-        violations.extend(order_violations)
-        warnings.extend(order_warnings)
+        violations.update(order_violations)
+        warnings.update(order_warnings)
+
+    return order_reports, violations, warnings, net_exposure
+
+
+def evaluate_compliance(
+    plan: Mapping[str, Any],
+    *,
+    current_position_oz: float = 0.0,
+    limits: Optional[RiskLimits] = None,
+    settings: Optional[Settings] = None,
+) -> Dict[str, Any]:
+    """Evaluate a trade plan against compliance guardrails."""
+
+    effective_settings = settings or get_settings()
+    config = build_compliance_config(effective_settings)
+    risk_limits = limits or RiskLimits(
+        max_position_oz=effective_settings.max_position_oz,
+        stress_var_millions=effective_settings.stress_var_millions,
+        daily_drawdown_pct=effective_settings.daily_drawdown_pct,
+    )
+
+    orders = _extract_orders(plan)
+    order_reports, violations, warnings, net_exposure = _evaluate_orders(orders, config, risk_limits)
 
     projected_position = current_position_oz + net_exposure
     position_limit = risk_limits.max_position_oz
     if position_limit and abs(projected_position) > position_limit + 1e-6:
-        violations.append("projected_position_limit_breach")
+        violations.add("projected_position_limit_breach")
 
     summary = {
         "orders_checked": len(orders),
         "net_exposure_oz": net_exposure,
         "projected_position_oz": projected_position,
         "position_limit_oz": position_limit,
-        "violations": sorted(set(violations)),
-        "warnings": sorted(set(warnings)),
+        "violations": sorted(violations),
+        "warnings": sorted(warnings),
         "order_reports": order_reports,
     }
 
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
 from .base import (
     MarketDataAdapter,
     NewsDataAdapter,
@@ -13,15 +16,43 @@ from .base import (
     Capability,
     StreamingHandle,
 )
-from .yfinance_adapter import YahooFinanceAdapter
-from .alpha_vantage_adapter import AlphaVantageNewsAdapter
-from .alpha_vantage_fx_adapter import AlphaVantageFXAdapter
-from .ibkr_adapter import IBKRAdapter
-from .tanshu_gold_adapter import TanshuGoldAdapter
-from .twelvedata_adapter import TwelveDataAdapter
-from .polygon_adapter import PolygonAdapter
-
-__all__ = [
+
+if TYPE_CHECKING:  # pragma: no cover - static analysis only
+    from .yfinance_adapter import YahooFinanceAdapter
+    from .alpha_vantage_adapter import AlphaVantageNewsAdapter
+    from .alpha_vantage_fx_adapter import AlphaVantageFXAdapter
+    from .ibkr_adapter import IBKRAdapter
+    from .tanshu_gold_adapter import TanshuGoldAdapter
+    from .twelvedata_adapter import TwelveDataAdapter
+    from .polygon_adapter import PolygonAdapter
+
+# Adapter modules pull in heavy vendor SDKs (yfinance, ib_insync, ...), so they
+# are only imported when first accessed (PEP 562).
+_LAZY_ADAPTERS: Dict[str, str] = {
+    "YahooFinanceAdapter": ".yfinance_adapter",
+    "AlphaVantageNewsAdapter": ".alpha_vantage_adapter",
+    "AlphaVantageFXAdapter": ".alpha_vantage_fx_adapter",
+    "IBKRAdapter": ".ibkr_adapter",
+    "TanshuGoldAdapter": ".tanshu_gold_adapter",
+    "TwelveDataAdapter": ".twelvedata_adapter",
+    "PolygonAdapter": ".polygon_adapter",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ADAPTERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ADAPTERS))
+
+
+__all__ = (
     "MarketDataAdapter",
     "NewsDataAdapter",
     "DataSourceAdapter",
@@ -38,4 +69,4 @@ __all__ = [
     "TanshuGoldAdapter",
     "TwelveDataAdapter",
     "PolygonAdapter",
-]
+)
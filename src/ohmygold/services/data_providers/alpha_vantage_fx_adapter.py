@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
-import requests
 from requests import Session
 
-from .base import DataSourceAdapter
+from .base import DataSourceAdapter, build_pooled_session, decode_json_response, resolve_price_dtype
 from ..exceptions import DataProviderError
 
 
@@ -20,6 +22,10 @@ class _ParsedSymbol:
     quote: str
 
 
+_SYMBOL_LEGS_RE = re.compile(r"([A-Z]{3})([A-Z]{3})")
+
+
+@lru_cache(maxsize=64)
 def _parse_symbol(symbol: str) -> _ParsedSymbol:
     """Split symbols such as ``XAUUSD`` into base/quote legs."""
 
@@ -28,13 +34,12 @@ def _parse_symbol(symbol: str) -> _ParsedSymbol:
         raise DataProviderError(
             f"Alpha Vantage requires FX-style symbols like XAUUSD; got '{symbol}'"
         )
-    base = sanitized[:3]
-    quote = sanitized[3:6]
-    if not base.isalpha() or not quote.isalpha():
+    match = _SYMBOL_LEGS_RE.match(sanitized)
+    if match is None:
         raise DataProviderError(
             f"Alpha Vantage symbol must contain only letters; got '{symbol}'"
         )
-    return _ParsedSymbol(base=base, quote=quote)
+    return _ParsedSymbol(base=match.group(1), quote=match.group(2))
 
 
 class AlphaVantageFXAdapter(DataSourceAdapter):
@@ -42,8 +47,15 @@ class AlphaVantageFXAdapter(DataSourceAdapter):
 
     _API_URL = "https://www.alphavantage.co/query"
 
-    def __init__(self, api_key: Optional[str]) -> None:
+    def __init__(self, api_key: Optional[str], *, precision: str = "float64") -> None:
         self._api_key = api_key
+        self._price_dtype = resolve_price_dtype(precision)
+        self._session: Optional[Session] = None
+
+    def _get_session(self) -> Session:
+        if self._session is None:
+            self._session = build_pooled_session()
+        return self._session
 
     def fetch_price_history(
         self,
@@ -64,10 +76,10 @@ class AlphaVantageFXAdapter(DataSourceAdapter):
             "outputsize": "full",
             "apikey": self._api_key,
         }
-        requester = session.get if session else requests.get
+        requester = (session or self._get_session()).get
         response = requester(self._API_URL, params=params, timeout=30)
         response.raise_for_status()
-        payload = response.json()
+        payload = decode_json_response(response)
 
         time_series = payload.get("Time Series FX (Daily)")
         if not time_series:
@@ -79,40 +91,56 @@ class AlphaVantageFXAdapter(DataSourceAdapter):
                 raise DataProviderError(f"Alpha Vantage error: {error_message}")
             raise DataProviderError("Alpha Vantage response missing FX time series data")
 
-        records = []
+        # Alpha Vantage encodes prices as JSON strings; keep them raw here and
+        # let numpy convert every column in one vectorised cast below.
+        dates: List[str] = []
+        opens: List[Any] = []
+        highs: List[Any] = []
+        lows: List[Any] = []
+        closes: List[Any] = []
         for date_str, values in time_series.items():
             try:
-                dt = datetime.strptime(date_str, "%Y-%m-%d")
-                open_price = float(values["1. open"])
-                high_price = float(values["2. high"])
-                low_price = float(values["3. low"])
-                close_price = float(values["4. close"])
-            except (KeyError, ValueError) as exc:
+                opens.append(values["1. open"])
+                highs.append(values["2. high"])
+                lows.append(values["3. low"])
+                closes.append(values["4. close"])
+            except KeyError as exc:
                 raise DataProviderError(
                     f"Malformed Alpha Vantage FX data for {symbol} on {date_str}"
                 ) from exc
+            dates.append(date_str)
 
-            records.append(
-                {
-                    "Date": dt,
-                    "Open": open_price,
-                    "High": high_price,
-                    "Low": low_price,
-                    "Close": close_price,
-                    "Adj Close": close_price,
-                    "Volume": 0.0,
-                }
-            )
-
-        if not records:
+        if not dates:
             return pd.DataFrame(columns=["Open", "High", "Low", "Close", "Adj Close", "Volume"])
 
-        df = pd.DataFrame.from_records(records)
-        df["Date"] = pd.to_datetime(df["Date"])
-        df.set_index("Date", inplace=True)
-        df.sort_index(inplace=True)
+        try:
+            index = pd.DatetimeIndex(pd.to_datetime(dates, format="%Y-%m-%d"), name="Date")
+        except ValueError as exc:
+            raise DataProviderError(f"Malformed Alpha Vantage FX dates for {symbol}") from exc
+
+        try:
+            prices = np.array([opens, highs, lows, closes], dtype=self._price_dtype)
+        except (TypeError, ValueError) as exc:
+            raise DataProviderError(f"Malformed Alpha Vantage FX prices for {symbol}") from exc
+
+        df = pd.DataFrame(
+            {
+                "Open": prices[0],
+                "High": prices[1],
+                "Low": prices[2],
+                "Close": prices[3],
+                "Adj Close": prices[3],
+                "Volume": np.zeros(len(dates), dtype=np.float64),
+            },
+            index=index,
+        )
+        # Alpha Vantage returns newest-first; reversing is cheaper than a full sort.
+        if df.index.is_monotonic_decreasing:
+            df = df.iloc[::-1]
+        elif not df.index.is_monotonic_increasing:
+            df = df.sort_index()
 
         start_date = pd.Timestamp(start.date())
         end_date = pd.Timestamp(end.date())
-        df = df[(df.index >= start_date) & (df.index <= end_date)]
+        df = df.loc[start_date:end_date]
         return df
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any, Callable, Dict, Iterator, NamedTuple, Optional
 
 try:  # Python 3.11+
@@ -12,8 +12,77 @@ try:  # Python 3.11+
 except ImportError:  # pragma: no cover - Python < 3.8 not supported
     from typing_extensions import Literal  # type: ignore
 
+import numpy as np
 import pandas as pd
-from requests import Session
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ..exceptions import DataProviderError
+
+try:  # pragma: no cover - optional accelerated JSON decoder
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+def build_pooled_session(
+    *,
+    pool_connections: int = 4,
+    pool_maxsize: int = 16,
+    retry_total: int = 3,
+    retry_backoff: float = 0.5,
+) -> Session:
+    """Return a keep-alive ``Session`` with a pooled, retrying HTTP adapter.
+
+    Adapters hold on to one of these when callers do not supply a session so
+    repeated fetches reuse TCP/TLS connections instead of reconnecting.
+    """
+
+    retry = Retry(
+        total=retry_total,
+        backoff_factor=retry_backoff,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry,
+    )
+    session = Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_PRICE_DTYPES: Dict[str, Any] = {"float64": np.float64, "float32": np.float32}
+
+
+def resolve_price_dtype(precision: Optional[str]) -> Any:
+    """Map a ``market_data_precision`` setting to the numpy dtype for price columns.
+
+    ``Volume`` always stays float64.
+    """
+
+    key = (precision or "float64").strip().lower()
+    try:
+        return _PRICE_DTYPES[key]
+    except KeyError:
+        raise DataProviderError(f"不支持的行情数值精度：{precision}（可选 float64 / float32）") from None
+
+
+def decode_json_response(response: Response) -> Any:
+    """Decode a JSON response body, preferring ``orjson`` when installed.
+
+    ``orjson`` parses the raw bytes directly, skipping requests' charset
+    detection and text decode; both decoders raise ``ValueError`` subclasses.
+    """
+
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
 
 
 class MarketDataAdapter(ABC):
@@ -118,6 +187,16 @@ class DataSourceAdapter(MarketDataAdapter):
     def configure_retry(self, retry: RetryConfig) -> None:
         """Inject retry settings; default为 no-op。"""
 
+    def fetch_latest(self, symbol: str, *, session: Optional[Session] = None) -> Optional[float]:
+        """Return the latest close; default取最近一周日线的最后一根。"""
+
+        end = datetime.now(timezone.utc)
+        frame = self.fetch_price_history(symbol, start=end - timedelta(days=7), end=end, session=session)
+        if frame.empty or "Close" not in frame.columns:
+            return None
+        value = float(frame["Close"].iloc[-1])
+        return value if np.isfinite(value) else None
+
     def snapshot(self, symbol: str) -> QuoteSnapshot:
         """Return a quick snapshot; raise if provider无法支持。"""
 
@@ -146,13 +225,12 @@ class DataSourceAdapter(MarketDataAdapter):
 
         frame = self.fetch_price_history(symbol, start=start, end=end)
         if frame.empty:
-            return iter(())
-        records = frame.to_dict(orient="records")
-        timestamps = frame.index.to_pydatetime()
-        enriched = []
-        for idx, record in enumerate(records):
-            payload = dict(record)
-            payload["timestamp"] = timestamps[idx]
+            return
+        columns = list(frame.columns)
+        # itertuples(name=None) yields plain tuples, so column labels with
+        # spaces (e.g. "Adj Close") survive and no per-frame dict list is built.
+        for timestamp, row in zip(frame.index.to_pydatetime(), frame.itertuples(index=False, name=None)):
+            payload = dict(zip(columns, row))
+            payload["timestamp"] = timestamp
             payload["timeframe"] = timeframe
-            enriched.append(payload)
-        return iter(enriched)
+            yield payload
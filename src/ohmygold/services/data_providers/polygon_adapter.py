@@ -3,19 +3,27 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from requests import Session
 
 from ..exceptions import DataProviderError
-from .base import DataSourceAdapter
+from .base import DataSourceAdapter, build_pooled_session, decode_json_response, resolve_price_dtype
 
-try:  # pragma: no cover - optional dependency resolution handled at runtime
-    import requests  # type: ignore
-except Exception:  # pragma: no cover
-    requests = None  # type: ignore
+try:  # pragma: no cover - optional columnar decoding
+    import pyarrow as pa  # type: ignore
+    import pyarrow.compute as pc  # type: ignore
+except ImportError:  # pragma: no cover
+    pa = None  # type: ignore
+    pc = None  # type: ignore
+
+_COLUMNS = ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
+_VALUE_KEYS = ("o", "h", "l", "c", "v")
+# Upper bound on next_url hops so a misbehaving cursor cannot loop forever.
+_MAX_PAGES = 20
 
 
 class PolygonAdapter(DataSourceAdapter):
@@ -27,14 +35,20 @@ class PolygonAdapter(DataSourceAdapter):
         *,
         base_url: str = "https://api.polygon.io",
         symbol_map: Optional[Dict[str, str]] = None,
+        precision: str = "float64",
     ) -> None:
         if not api_key:
             raise DataProviderError("Polygon API key 未配置，请设置 settings.polygon_api_key")
-        if requests is None:
-            raise DataProviderError("requests 库不可用，无法调用 Polygon 接口")
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.symbol_map = {str(key).upper(): str(value) for key, value in (symbol_map or {}).items()}
+        self._price_dtype = resolve_price_dtype(precision)
+        self._session: Optional[Session] = None
+
+    def _get_session(self) -> Session:
+        if self._session is None:
+            self._session = build_pooled_session()
+        return self._session
 
     def _resolve_symbol(self, symbol: str) -> str:
         mapped = self.symbol_map.get(symbol.upper())
@@ -52,12 +66,59 @@ class PolygonAdapter(DataSourceAdapter):
         start_str = start.strftime("%Y-%m-%d")
         end_str = end.strftime("%Y-%m-%d")
         url = f"{self.base_url}/v2/aggs/ticker/{ticker}/range/1/day/{start_str}/{end_str}"
-        params = {"adjusted": "true", "sort": "asc", "limit": 50000, "apiKey": self.api_key}
-        client = session or requests
+        params: Dict[str, Any] = {"adjusted": "true", "sort": "asc", "limit": 50000, "apiKey": self.api_key}
+        client = session or self._get_session()
+
+        rows: List[Dict[str, Any]] = []
+        for _ in range(_MAX_PAGES):
+            payload = self._request_page(client, url, params)
+            results = payload.get("results")
+            if isinstance(results, list):
+                rows.extend(item for item in results if isinstance(item, dict))
+            next_url = payload.get("next_url")
+            if not isinstance(next_url, str) or not next_url:
+                break
+            # next_url already carries the cursor and query; only the key is re-sent.
+            url, params = next_url, {"apiKey": self.api_key}
+
+        if not rows:
+            return pd.DataFrame(columns=_COLUMNS)
+
+        columns = _columns_from_arrow(rows) if pa is not None else None
+        if columns is None:
+            columns = _columns_from_rows(rows)
+        stamps, values = columns
+        valid = np.isfinite(stamps)
+        if not valid.any():
+            return pd.DataFrame(columns=_COLUMNS)
+
+        dtype = self._price_dtype
+        closes = values["c"][valid].astype(dtype, copy=False)
+        frame = pd.DataFrame(
+            {
+                "Open": values["o"][valid].astype(dtype, copy=False),
+                "High": values["h"][valid].astype(dtype, copy=False),
+                "Low": values["l"][valid].astype(dtype, copy=False),
+                "Close": closes,
+                "Adj Close": closes,
+                # Volume stays float64 like market_data's precision cast; float32
+                # loses integer precision on large volumes.
+                "Volume": values["v"][valid],
+            },
+            index=pd.DatetimeIndex(pd.to_datetime(stamps[valid].astype(np.int64), unit="ms"), name="Date"),
+        )
+        # Requested with sort=asc, so the O(n) monotonic check normally
+        # short-circuits the sort.
+        if not frame.index.is_monotonic_increasing:
+            frame = frame.sort_index()
+        return frame
+
+    @staticmethod
+    def _request_page(client: Any, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
         try:  # pragma: no cover - exercises live HTTP path during integration testing
             response = client.get(url, params=params, timeout=6)  # type: ignore[call-arg]
             response.raise_for_status()
-            payload = response.json()
+            payload = decode_json_response(response)
         except Exception as exc:  # pragma: no cover
             raise DataProviderError(f"Polygon 数据获取失败：{exc}") from exc
 
@@ -68,39 +129,39 @@ class PolygonAdapter(DataSourceAdapter):
         if status != "OK":
             error = payload.get("error") or payload.get("message") or "未知错误"
             raise DataProviderError(f"Polygon 返回错误：{error}")
-
-        results = payload.get("results")
-        if not isinstance(results, list) or not results:
-            return pd.DataFrame(columns=["Open", "High", "Low", "Close", "Adj Close", "Volume"])
-
-        records = []
-        for item in results:
-            if not isinstance(item, dict):
-                continue
-            ts = item.get("t")
-            try:
-                timestamp = datetime.utcfromtimestamp(int(ts) / 1000)
-            except Exception:
-                continue
-            records.append(
-                {
-                    "Date": timestamp,
-                    "Open": float(item.get("o", 0.0)),
-                    "High": float(item.get("h", 0.0)),
-                    "Low": float(item.get("l", 0.0)),
-                    "Close": float(item.get("c", 0.0)),
-                    "Adj Close": float(item.get("c", 0.0)),
-                    "Volume": float(item.get("v", 0.0)),
-                }
-            )
-
-        if not records:
-            return pd.DataFrame(columns=["Open", "High", "Low", "Close", "Adj Close", "Volume"])
-
-        frame = pd.DataFrame.from_records(records)
-        frame.set_index("Date", inplace=True)
-        frame.sort_index(inplace=True)
-        return frame
+        return payload
+
+
+def _columns_from_rows(rows: List[Dict[str, Any]]) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    count = len(rows)
+    stamps = pd.to_numeric(
+        pd.Series([item.get("t") for item in rows], dtype=object), errors="coerce"
+    ).to_numpy(dtype=np.float64, na_value=np.nan)
+    values = {
+        key: np.fromiter((float(item.get(key, 0.0)) for item in rows), dtype=np.float64, count=count)
+        for key in _VALUE_KEYS
+    }
+    return stamps, values
+
+
+def _columns_from_arrow(rows: List[Dict[str, Any]]) -> Optional[Tuple[np.ndarray, Dict[str, np.ndarray]]]:
+    """Columnar conversion through pyarrow; ``None`` when the rows are not uniformly typed."""
+
+    try:
+        table = pa.Table.from_pylist(rows)
+        if "t" not in table.column_names:
+            return None
+        stamps = pc.cast(table.column("t"), pa.float64()).to_numpy()
+        values: Dict[str, np.ndarray] = {}
+        for key in _VALUE_KEYS:
+            if key in table.column_names:
+                column = pc.cast(table.column(key), pa.float64()).fill_null(0.0)
+                values[key] = column.to_numpy()
+            else:
+                values[key] = np.zeros(table.num_rows, dtype=np.float64)
+    except (pa.ArrowException, TypeError, ValueError):
+        return None
+    return stamps, values
 
 
 __all__ = ["PolygonAdapter"]
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import re
 from datetime import datetime, timezone
-from typing import Dict, Iterable, Optional
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import requests
 from requests import Session
@@ -13,29 +15,42 @@ try:
 except ImportError:  # pragma: no cover - Python < 3.9 fallback
     ZoneInfo = None  # type: ignore[assignment]
 
-from .base import DataSourceAdapter
+from .base import DataSourceAdapter, build_pooled_session, decode_json_response
 from ..exceptions import DataProviderError
 
+# Tanshu timestamps are released in Beijing time (UTC+8).
+try:
+    _SOURCE_TZ = ZoneInfo("Asia/Shanghai") if ZoneInfo is not None else None
+    _UTC_TZ = ZoneInfo("UTC") if ZoneInfo is not None else None
+except Exception:  # pragma: no cover - missing tz database
+    _SOURCE_TZ = _UTC_TZ = None
+_TIMESTAMP_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d")
+# Canonical ``YYYY-MM-DD[ HH:MM[:SS]]`` shape, parsed without strptime.
+_TIMESTAMP_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})(?: (\d{2}):(\d{2})(?::(\d{2}))?)?")
+
 
 def _to_float(value: object) -> Optional[float]:
     """Convert loosely formatted numeric strings to floats."""
 
-    if value is None:
-        return None
     if isinstance(value, (int, float)):
         return float(value)
-    if isinstance(value, str):
-        cleaned = value.strip()
-        if not cleaned or cleaned in {"-", "--"}:
-            return None
-        cleaned = cleaned.replace(",", "")
-        if cleaned.endswith("%"):
-            cleaned = cleaned[:-1]
-        try:
-            return float(cleaned)
-        except ValueError:
-            return None
-    return None
+    if not isinstance(value, str):
+        return None
+    try:
+        # Most quotes are already clean numeric strings.
+        return float(value)
+    except ValueError:
+        pass
+    cleaned = value.strip()
+    if not cleaned or cleaned in {"-", "--"}:
+        return None
+    cleaned = cleaned.replace(",", "")
+    if cleaned.endswith("%"):
+        cleaned = cleaned[:-1]
+    try:
+        return float(cleaned)
+    except ValueError:
+        return None
 
 
 class TanshuGoldAdapter(DataSourceAdapter):
@@ -61,6 +76,15 @@ class TanshuGoldAdapter(DataSourceAdapter):
             if isinstance(key, str)
         }
         self._default_symbol_code = (default_symbol_code or "").strip()
+        self._session: Optional[Session] = None
+        # symbol -> (candidates, upper-cased candidates, upper-cased set); the
+        # map and default code are fixed after construction.
+        self._code_cache: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...], FrozenSet[str]]] = {}
+
+    def _get_session(self) -> Session:
+        if self._session is None:
+            self._session = build_pooled_session(pool_maxsize=8)
+        return self._session
 
     # pylint: disable=too-many-locals
     def fetch_price_history(
@@ -74,15 +98,15 @@ class TanshuGoldAdapter(DataSourceAdapter):
         start_utc = start.astimezone(timezone.utc).replace(tzinfo=None) if start.tzinfo else start
         end_utc = end.astimezone(timezone.utc).replace(tzinfo=None) if end.tzinfo else end
 
-        requester = session.get if session else requests.get
+        requester = (session or self._get_session()).get
         url = f"{self._BASE_URL}/{self._endpoint}"
         try:
             response = requester(url, params={"key": self._api_key}, timeout=30)
             response.raise_for_status()
-            payload = response.json()
+            payload = decode_json_response(response)
         except requests.RequestException as exc:  # pragma: no cover - live call
             raise DataProviderError(f"探数接口请求失败：{exc}") from exc
-        except ValueError as exc:  # payload.json() failure
+        except ValueError as exc:  # JSON decode failure (json or orjson)
             raise DataProviderError("探数接口返回了无法解析的JSON") from exc
 
         if payload.get("code") != 1:
@@ -121,88 +145,109 @@ class TanshuGoldAdapter(DataSourceAdapter):
 
         timestamp = self._parse_timestamp(entry.get("updatetime"))
 
-        record = {
-            "Open": open_price,
-            "High": high_price,
-            "Low": low_price,
-            "Close": close_price,
-            "Adj Close": adj_close,
-            "Volume": volume,
-        }
-
-        df = pd.DataFrame([record])
-        df.index = pd.to_datetime([timestamp])
-        df.index.name = "Date"
-        return df.loc[(df.index >= start_utc) & (df.index <= end_utc)]
+        # Fixed single-row schema: build float64 columns directly rather than
+        # letting pandas infer types from a list of records.
+        df = pd.DataFrame(
+            {
+                "Open": np.array([open_price], dtype=np.float64),
+                "High": np.array([high_price], dtype=np.float64),
+                "Low": np.array([low_price], dtype=np.float64),
+                "Close": np.array([close_price], dtype=np.float64),
+                "Adj Close": np.array([adj_close], dtype=np.float64),
+                "Volume": np.array([volume], dtype=np.float64),
+            },
+            index=pd.DatetimeIndex([timestamp], name="Date"),
+        )
+        if start_utc <= timestamp <= end_utc:
+            return df
+        return df.iloc[:0]
 
     def _find_entry(self, listing: object, symbol: str) -> Optional[Dict[str, object]]:
         """Locate the entry matching the requested symbol."""
 
-        candidates = list(self._candidate_codes(symbol))
+        candidates, upper_codes, code_set = self._lookup_codes(symbol)
 
         if isinstance(listing, dict):
             for code in candidates:
-                if code and code in listing and isinstance(listing[code], dict):
+                if code in listing and isinstance(listing[code], dict):
                     return listing[code]
             # Sometimes the dict keys are arbitrary but values contain ``type`` fields.
             for value in listing.values():
-                if isinstance(value, dict) and self._matches_entry(value, candidates):
+                if isinstance(value, dict) and self._matches_entry(value, code_set, upper_codes):
                     return value
             return None
 
         if isinstance(listing, list):
             for item in listing:
-                if isinstance(item, dict) and self._matches_entry(item, candidates):
+                if isinstance(item, dict) and self._matches_entry(item, code_set, upper_codes):
                     return item
 
         return None
 
-    def _candidate_codes(self, symbol: str) -> Iterable[str]:
+    def _lookup_codes(self, symbol: str) -> Tuple[Tuple[str, ...], Tuple[str, ...], FrozenSet[str]]:
+        cached = self._code_cache.get(symbol)
+        if cached is None:
+            candidates = tuple(self._candidate_codes(symbol))
+            # Entries are matched with a set lookup on ``type`` and a
+            # substring scan on ``typename``, both against upper-cased codes.
+            upper_codes = tuple(dict.fromkeys(code.upper() for code in candidates))
+            cached = (candidates, upper_codes, frozenset(upper_codes))
+            self._code_cache[symbol] = cached
+        return cached
+
+    def _candidate_codes(self, symbol: str) -> List[str]:
         symbol_norm = (symbol or "").upper()
         stripped = symbol_norm.replace("/", "")
         mapped = self._symbol_map.get(symbol_norm) or self._symbol_map.get(stripped)
         default = self._default_symbol_code.upper() if self._default_symbol_code else ""
-        return [
-            mapped or "",
-            default,
-            symbol_norm,
-            stripped,
-            symbol_norm[:3],
-        ]
+        ordered = (mapped or "", default, symbol_norm, stripped, symbol_norm[:3])
+        # Drop blanks and repeats (symbol_norm usually equals stripped).
+        return [code for code in dict.fromkeys(ordered) if code]
 
     @staticmethod
-    def _matches_entry(entry: Dict[str, object], candidates: Iterable[str]) -> bool:
-        entry_type = str(entry.get("type", "")).upper()
+    def _matches_entry(entry: Dict[str, object], code_set: FrozenSet[str], upper_codes: Iterable[str]) -> bool:
+        if str(entry.get("type", "")).upper() in code_set:
+            return True
         entry_name = str(entry.get("typename", "")).upper()
-        for code in candidates:
-            if not code:
+        return any(code in entry_name for code in upper_codes)
+
+    @staticmethod
+    def _parse_timestamp_text(value: str) -> Optional[datetime]:
+        match = _TIMESTAMP_RE.fullmatch(value)
+        if match is not None:
+            year, month, day, hour, minute, second = match.groups()
+            try:
+                return datetime(
+                    int(year),
+                    int(month),
+                    int(day),
+                    int(hour or 0),
+                    int(minute or 0),
+                    int(second or 0),
+                )
+            except ValueError:
+                return None
+        # Non-canonical spellings (e.g. single-digit months) keep strptime's leniency.
+        for fmt in _TIMESTAMP_FORMATS:
+            try:
+                return datetime.strptime(value, fmt)
+            except ValueError:
                 continue
-            code_upper = code.upper()
-            if entry_type == code_upper or code_upper in entry_name:
-                return True
-        return False
+        return None
 
     @staticmethod
     def _parse_timestamp(value: object) -> datetime:
         if isinstance(value, datetime):
             return value
         if isinstance(value, str):
-            for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d"):
-                try:
-                    parsed = datetime.strptime(value, fmt)
-                    if ZoneInfo is not None:
-                        try:
-                            # Tanshu timestamps are released in Beijing time (UTC+8).
-                            parsed = (
-                                parsed.replace(tzinfo=ZoneInfo("Asia/Shanghai"))
-                                .astimezone(ZoneInfo("UTC"))
-                                .replace(tzinfo=None)
-                            )
-                        except Exception:  # pragma: no cover - defensive guard
-                            pass
-                    return parsed
-                except ValueError:
-                    continue
+            parsed = TanshuGoldAdapter._parse_timestamp_text(value)
+            if parsed is not None:
+                if _SOURCE_TZ is not None:
+                    try:
+                        parsed = parsed.replace(tzinfo=_SOURCE_TZ).astimezone(_UTC_TZ).replace(tzinfo=None)
+                    except Exception:  # pragma: no cover - defensive guard
+                        pass
+                return parsed
         # Fallback to current time so downstream freshness checks still work briefly.
         now_utc = datetime.now(timezone.utc).replace(microsecond=0)
         return now_utc.replace(tzinfo=None)
\ No newline at end of file
@@ -3,33 +3,62 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import requests
 from requests import Session
 
-from .base import DataSourceAdapter
+from .base import DataSourceAdapter, build_pooled_session, decode_json_response
 from ..exceptions import DataProviderError
 
 
 def _to_float(value: object) -> Optional[float]:
     """Coerce loosely formatted numeric values to floats."""
 
-    if value is None:
-        return None
     if isinstance(value, (int, float)):
         return float(value)
-    if isinstance(value, str):
-        cleaned = value.strip()
-        if not cleaned:
-            return None
-        cleaned = cleaned.replace(",", "")
-        try:
-            return float(cleaned)
-        except ValueError:
-            return None
-    return None
+    if not isinstance(value, str):
+        return None
+    try:
+        # Most candle fields are already clean numeric strings.
+        return float(value)
+    except ValueError:
+        pass
+    cleaned = value.strip().replace(",", "")
+    if not cleaned:
+        return None
+    try:
+        return float(cleaned)
+    except ValueError:
+        return None
+
+
+def _parse_timestamps(stamps: List[str]) -> np.ndarray:
+    """Parse timestamps to naive-UTC ``datetime64[ns]`` with unparseable entries as NaT."""
+
+    if not stamps:
+        return np.empty(0, dtype="datetime64[ns]")
+    # Twelve Data emits ISO-8601 strings, which parse in one vectorised pass;
+    # anything else is retried with per-element format inference.
+    parsed = pd.to_datetime(stamps, utc=True, format="ISO8601", errors="coerce")
+    if parsed.isna().any():
+        retry = pd.to_datetime(pd.Series(stamps), utc=True, format="mixed", errors="coerce")
+        parsed = parsed.where(~parsed.isna(), pd.DatetimeIndex(retry))
+    return parsed.tz_convert(None).as_unit("ns").to_numpy()
+
+
+def _symbol_variants(symbol_norm: str) -> Tuple[str, ...]:
+    """Return ``symbol_norm`` and its separator-stripped spellings, exact form first."""
+
+    variants = (
+        symbol_norm,
+        symbol_norm.replace("=", ""),
+        symbol_norm.replace("/", ""),
+        symbol_norm.replace("-", ""),
+    )
+    return tuple(dict.fromkeys(variants))
 
 
 class TwelveDataAdapter(DataSourceAdapter):
@@ -55,6 +84,16 @@ class TwelveDataAdapter(DataSourceAdapter):
             if isinstance(key, str) and value is not None
         }
         self._default_symbol = (default_symbol or "").strip()
+        self._default_aliases = frozenset(_symbol_variants(self._default_symbol.upper()))
+        self._session: Optional[Session] = None
+        # Symbol map and default are fixed after construction, so resolved
+        # codes can be memoised per requested symbol.
+        self._resolved_symbols: Dict[str, str] = {}
+
+    def _get_session(self) -> Session:
+        if self._session is None:
+            self._session = build_pooled_session(pool_maxsize=8)
+        return self._session
 
     def fetch_price_history(
         self,
@@ -89,12 +128,12 @@ class TwelveDataAdapter(DataSourceAdapter):
             "apikey": self._api_key,
         }
 
-        requester = session.get if session else requests.get
+        requester = (session or self._get_session()).get
         try:
             # Increased timeout to 60s to handle potential network latency (e.g. from China)
             response = requester(url, params=params, timeout=60)
             response.raise_for_status()
-            payload = response.json()
+            payload = decode_json_response(response)
         except requests.RequestException as exc:  # pragma: no cover - live call
             raise DataProviderError(f"Twelve Data 请求失败：{exc}") from exc
         except ValueError as exc:
@@ -108,58 +147,93 @@ class TwelveDataAdapter(DataSourceAdapter):
         if not values:
             raise DataProviderError("Twelve Data 返回空行情数据")
 
-        records = []
+        count = len(values)
+        stamps: List[str] = []
+        opens = np.empty(count, dtype=np.float64)
+        highs = np.empty(count, dtype=np.float64)
+        lows = np.empty(count, dtype=np.float64)
+        closes = np.empty(count, dtype=np.float64)
+        volumes = np.empty(count, dtype=np.float64)
+        filled = 0
         for entry in values:
             if not isinstance(entry, dict):
                 continue
             timestamp = entry.get("datetime")
             if not isinstance(timestamp, str):
                 continue
-            ts = pd.to_datetime(timestamp, utc=True, errors="coerce")
-            if pd.isna(ts):
-                continue
-            ts = ts.to_pydatetime().replace(tzinfo=None)
-
             close_price = _to_float(entry.get("close"))
             if close_price is None:
                 continue
-            open_price = _to_float(entry.get("open")) or close_price
-            high_price = _to_float(entry.get("high")) or close_price
-            low_price = _to_float(entry.get("low")) or close_price
             volume = _to_float(entry.get("volume"))
-            if volume is None:
-                volume = float("nan")
-
-            records.append(
-                {
-                    "Date": ts,
-                    "Open": open_price,
-                    "High": high_price,
-                    "Low": low_price,
-                    "Close": close_price,
-                    "Adj Close": close_price,
-                    "Volume": volume,
-                }
-            )
 
-        if not records:
+            stamps.append(timestamp)
+            opens[filled] = _to_float(entry.get("open")) or close_price
+            highs[filled] = _to_float(entry.get("high")) or close_price
+            lows[filled] = _to_float(entry.get("low")) or close_price
+            closes[filled] = close_price
+            volumes[filled] = np.nan if volume is None else volume
+            filled += 1
+
+        dates = _parse_timestamps(stamps)
+        valid = ~np.isnat(dates)
+        if not valid.any():
             raise DataProviderError("Twelve Data 行情记录无法解析")
 
-        df = pd.DataFrame.from_records(records)
-        df.sort_values("Date", inplace=True)
-        df.set_index("Date", inplace=True)
-        df.index.name = "Date"
-        return df.loc[(df.index >= start_utc) & (df.index <= end_utc)]
+        closes = closes[:filled][valid]
+        df = pd.DataFrame(
+            {
+                "Open": opens[:filled][valid],
+                "High": highs[:filled][valid],
+                "Low": lows[:filled][valid],
+                "Close": closes,
+                "Adj Close": closes,
+                "Volume": volumes[:filled][valid],
+            },
+            index=pd.DatetimeIndex(dates[valid], name="Date"),
+        )
+        # Requested with order=ASC, so the sort normally short-circuits.
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index(kind="stable")
+        return df.loc[start_utc:end_utc]
+
+    def fetch_latest(self, symbol: str, *, session: Optional[Session] = None) -> Optional[float]:
+        """Return the latest trade price from the lightweight ``/price`` endpoint."""
+
+        resolved_symbol = self._resolve_symbol(symbol)
+        if not resolved_symbol:
+            raise DataProviderError(f"Twelve Data 未找到 {symbol} 对应的交易代码")
+
+        requester = (session or self._get_session()).get
+        try:
+            response = requester(
+                f"{self._base_url}/price",
+                params={"symbol": resolved_symbol, "apikey": self._api_key},
+                timeout=60,
+            )
+            response.raise_for_status()
+            payload = decode_json_response(response)
+        except requests.RequestException as exc:  # pragma: no cover - live call
+            raise DataProviderError(f"Twelve Data 请求失败：{exc}") from exc
+        except ValueError as exc:
+            raise DataProviderError("Twelve Data 返回了无法解析的JSON") from exc
+
+        if not isinstance(payload, dict):
+            return None
+        if payload.get("status") == "error":
+            message = payload.get("message") or payload.get("error") or "Twelve Data 返回错误"
+            raise DataProviderError(message)
+        return _to_float(payload.get("price"))
 
     def _resolve_symbol(self, symbol: str) -> str:
+        resolved = self._resolved_symbols.get(symbol)
+        if resolved is None:
+            resolved = self._resolve_symbol_uncached(symbol)
+            self._resolved_symbols[symbol] = resolved
+        return resolved
+
+    def _resolve_symbol_uncached(self, symbol: str) -> str:
         symbol_norm = (symbol or "").upper()
-        candidates = {
-            symbol_norm,
-            symbol_norm.replace("=", ""),
-            symbol_norm.replace("/", ""),
-            symbol_norm.replace("-", ""),
-        }
-        for candidate in candidates:
+        for candidate in _symbol_variants(symbol_norm):
             mapped = self._symbol_map.get(candidate)
             if mapped:
                 return mapped
@@ -167,14 +241,7 @@ class TwelveDataAdapter(DataSourceAdapter):
         if not self._default_symbol:
             raise DataProviderError(f"Twelve Data 未配置 {symbol} 的交易代码映射")
 
-        default_norm = self._default_symbol.upper()
-        default_aliases = {
-            default_norm,
-            default_norm.replace("=", ""),
-            default_norm.replace("/", ""),
-            default_norm.replace("-", ""),
-        }
-        if symbol_norm in default_aliases or not symbol_norm:
+        if symbol_norm in self._default_aliases or not symbol_norm:
             return self._default_symbol
 
         raise DataProviderError(f"Twelve Data 未配置 {symbol} 的交易代码映射")
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 
 import pandas as pd
 import yfinance as yf
@@ -11,6 +11,19 @@ from requests import Session
 
 from .base import DataSourceAdapter
 
+_COLUMNS = ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
+
+# Symbols come from a small fixed set, so Ticker objects (and the cookies/crumb
+# they negotiate) are reused across calls instead of rebuilt per download.
+_TICKER_CACHE: Dict[str, yf.Ticker] = {}
+
+
+def _ticker(symbol: str) -> yf.Ticker:
+    ticker = _TICKER_CACHE.get(symbol)
+    if ticker is None:
+        ticker = _TICKER_CACHE[symbol] = yf.Ticker(symbol)
+    return ticker
+
 
 class YahooFinanceAdapter(DataSourceAdapter):
     """Fetch OHLCV data using the ``yfinance`` package."""
@@ -23,14 +36,22 @@ class YahooFinanceAdapter(DataSourceAdapter):
         end: datetime,
         session: Optional[Session] = None,
     ) -> pd.DataFrame:
-        # yfinance 与 requests-cache/curl_cffi 不兼容，显式禁用 session 以避免报错
-        data = yf.download(
-            symbol,
+        # yfinance 与 requests-cache/curl_cffi 不兼容，不传入 session 以避免报错
+        data = _ticker(symbol).history(
             start=start.strftime("%Y-%m-%d"),
             end=end.strftime("%Y-%m-%d"),
-            session=None,
+            interval="1d",
             auto_adjust=False,
-            progress=False,
+            actions=False,
         )
-        data.index = pd.to_datetime(data.index)
+        if data.empty:
+            return pd.DataFrame(columns=_COLUMNS)
+        data = data.reindex(columns=_COLUMNS)
+        index = pd.to_datetime(data.index)
+        # Ticker.history returns exchange-local timestamps; keep the naive
+        # dates yf.download produced.
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        data.index = index
+        data.index.name = "Date"
         return data
@@ -2,54 +2,274 @@
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, Iterable, Optional
 
+import numpy as np
 import pandas as pd
-from ta.momentum import RSIIndicator
-from ta.trend import MACD, SMAIndicator
-from ta.volatility import BollingerBands, AverageTrueRange
 
+try:  # pragma: no cover - optional JIT for the fused indicator kernel
+    from numba import njit
+except ImportError:  # pragma: no cover
+    njit = None
 
-def compute_indicators(history: pd.DataFrame) -> Dict[str, pd.Series]:
-    """Compute a collection of standard technical indicators."""
 
-    if history.empty:
-        return {}
+def _as_float(series: pd.Series) -> pd.Series:
+    """Return ``series`` as a float series, copying only non-float dtypes.
 
-    close = history["Close"].astype(float)
+    float32 histories (see ``market_data_precision``) are passed through
+    rather than widened up front.
+    """
 
-    indicators: Dict[str, pd.Series] = {
-        "sma_20": SMAIndicator(close, window=20, fillna=True).sma_indicator(),
-        "sma_50": SMAIndicator(close, window=50, fillna=True).sma_indicator(),
-        "rsi_14": RSIIndicator(close, window=14, fillna=True).rsi(),
-    }
+    return series if series.dtype in (np.float64, np.float32) else series.astype(np.float64)
 
-    if len(history) >= 14:
-        atr = AverageTrueRange(
-            high=history["High"].astype(float),
-            low=history["Low"].astype(float),
-            close=close,
-            window=14,
-            fillna=True,
-        )
-        indicators["atr_14"] = atr.average_true_range()
 
-    macd = MACD(close, window_slow=26, window_fast=12, window_sign=9, fillna=True)
-    indicators.update(
-        {
-            "macd": macd.macd(),
-            "macd_signal": macd.macd_signal(),
-            "macd_diff": macd.macd_diff(),
-        }
+def _fill_gaps(series: pd.Series, value: float | None) -> pd.Series:
+    """Replace infinities and gaps: forward-fill, then ``value`` or back-fill when ``None``."""
+
+    cleaned = series.replace([np.inf, -np.inf], np.nan).ffill()
+    return cleaned.bfill() if value is None else cleaned.fillna(value)
+
+
+def _ema(series: pd.Series, span: int) -> pd.Series:
+    return series.ewm(span=span, min_periods=0, adjust=False).mean()
+
+
+def _rsi(close: pd.Series, window: int) -> pd.Series:
+    delta = close.diff(1)
+    gains = delta.where(delta > 0, 0.0)
+    losses = -delta.where(delta < 0, 0.0)
+    avg_gain = gains.ewm(alpha=1 / window, min_periods=0, adjust=False).mean()
+    avg_loss = losses.ewm(alpha=1 / window, min_periods=0, adjust=False).mean()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = np.where(avg_loss == 0, 100, 100 - (100 / (1 + avg_gain / avg_loss)))
+    return _fill_gaps(pd.Series(rsi, index=close.index, name="rsi"), 50)
+
+
+def _atr(high: pd.Series, low: pd.Series, close: pd.Series, window: int) -> pd.Series:
+    prev_close = close.shift(1).to_numpy()
+    high_values = high.to_numpy()
+    low_values = low.to_numpy()
+    # fmax skips the NaN previous close on the first bar, like a row-wise max.
+    true_range = np.fmax(
+        np.fmax(high_values - low_values, np.abs(high_values - prev_close)),
+        np.abs(low_values - prev_close),
     )
+    atr = np.zeros(len(true_range))
+    # Wilder smoothing seeded with the first window's mean is an adjust=False
+    # EWM with alpha=1/window over [seed, tr[window], tr[window + 1], ...].
+    seeded = np.concatenate(([true_range[:window].mean()], true_range[window:]))
+    atr[window - 1 :] = pd.Series(seeded).ewm(alpha=1 / window, adjust=False).mean().to_numpy()
+    return _fill_gaps(pd.Series(atr, index=close.index, name="atr"), 0)
+
+
+def _fused_indicators(close, high, low, out):  # pragma: no cover - compiled by numba
+    """Single pass over the bars filling every indicator column of ``out``.
+
+    Rows of ``out``: sma20, sma50, rsi14, atr14, macd, macd_signal, bb_mavg,
+    bb_std. Semantics mirror the pandas path (``min_periods=0`` windows,
+    ``adjust=False`` EWMs, Wilder RSI/ATR) for finite inputs.
+    """
+
+    n = close.shape[0]
+    alpha12 = 2.0 / 13.0
+    alpha26 = 2.0 / 27.0
+    alpha9 = 2.0 / 10.0
+    wilder = 1.0 / 14.0
+    # Window sums are taken relative to the first close so the Bollinger
+    # variance does not lose precision to catastrophic cancellation.
+    shift = close[0]
+    sum20 = 0.0
+    sumsq20 = 0.0
+    sum50 = 0.0
+    ema12 = close[0]
+    ema26 = close[0]
+    signal = 0.0
+    avg_gain = 0.0
+    avg_loss = 0.0
+    tr_seed = 0.0
+    atr = 0.0
+    for i in range(n):
+        x = close[i]
+        dx = x - shift
+        sum20 += dx
+        sumsq20 += dx * dx
+        sum50 += dx
+        if i >= 20:
+            old = close[i - 20] - shift
+            sum20 -= old
+            sumsq20 -= old * old
+        if i >= 50:
+            sum50 -= close[i - 50] - shift
+        count20 = min(i + 1, 20)
+        mean20 = sum20 / count20
+        out[0, i] = shift + mean20
+        out[1, i] = shift + sum50 / min(i + 1, 50)
+        out[6, i] = out[0, i]
+        out[7, i] = np.sqrt(max(sumsq20 / count20 - mean20 * mean20, 0.0))
+
+        if i > 0:
+            delta = x - close[i - 1]
+            gain = delta if delta > 0.0 else 0.0
+            loss = -delta if delta < 0.0 else 0.0
+            avg_gain = (1.0 - wilder) * avg_gain + wilder * gain
+            avg_loss = (1.0 - wilder) * avg_loss + wilder * loss
+            ema12 = (1.0 - alpha12) * ema12 + alpha12 * x
+            ema26 = (1.0 - alpha26) * ema26 + alpha26 * x
+        macd = ema12 - ema26
+        signal = macd if i == 0 else (1.0 - alpha9) * signal + alpha9 * macd
+        out[4, i] = macd
+        out[5, i] = signal
+        out[2, i] = 100.0 if avg_loss == 0.0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+        true_range = high[i] - low[i]
+        if i > 0:
+            true_range = max(true_range, abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+        if i < 13:
+            tr_seed += true_range
+            out[3, i] = 0.0
+        elif i == 13:
+            atr = (tr_seed + true_range) / 14.0
+            out[3, i] = atr
+        else:
+            atr = (1.0 - wilder) * atr + wilder * true_range
+            out[3, i] = atr
+
+
+_fused_kernel = njit(cache=True)(_fused_indicators) if njit is not None else None
+
+
+def _compute_fused(history: pd.DataFrame, close: pd.Series) -> Dict[str, pd.Series] | None:
+    """Run the numba kernel when available and the inputs are finite."""
+
+    if _fused_kernel is None:
+        return None
+    close_values = np.ascontiguousarray(close.to_numpy(), dtype=np.float64)
+    with_atr = len(history) >= 14
+    if with_atr:
+        high_values = np.ascontiguousarray(history["High"].to_numpy(), dtype=np.float64)
+        low_values = np.ascontiguousarray(history["Low"].to_numpy(), dtype=np.float64)
+    else:
+        high_values = low_values = close_values
+    if not (np.isfinite(close_values).all() and np.isfinite(high_values).all() and np.isfinite(low_values).all()):
+        return None
+
+    out = np.empty((8, len(close_values)), dtype=np.float64)
+    _fused_kernel(close_values, high_values, low_values, out)
 
-    bb = BollingerBands(close, window=20, window_dev=2.0, fillna=True)
+    index = close.index
+    sma20, sma50, rsi, atr, macd, macd_signal, bb_mavg, bb_std = out
+    indicators: Dict[str, pd.Series] = {
+        "sma_20": pd.Series(sma20, index=index, name="sma_20"),
+        "sma_50": pd.Series(sma50, index=index, name="sma_50"),
+        "rsi_14": pd.Series(rsi, index=index, name="rsi"),
+    }
+    if with_atr:
+        indicators["atr_14"] = pd.Series(atr, index=index, name="atr")
     indicators.update(
         {
-            "bb_high": bb.bollinger_hband(),
-            "bb_low": bb.bollinger_lband(),
-            "bb_mavg": bb.bollinger_mavg(),
+            "macd": pd.Series(macd, index=index, name="MACD_12_26"),
+            "macd_signal": pd.Series(macd_signal, index=index, name="MACD_sign_12_26"),
+            "macd_diff": pd.Series(macd - macd_signal, index=index, name="MACD_diff_12_26"),
+            "bb_high": pd.Series(bb_mavg + 2.0 * bb_std, index=index, name="hband"),
+            "bb_low": pd.Series(bb_mavg - 2.0 * bb_std, index=index, name="lband"),
+            "bb_mavg": pd.Series(bb_mavg, index=index, name="mavg"),
         }
     )
-
     return indicators
+
+
+_MACD_KEYS = frozenset({"macd", "macd_signal", "macd_diff"})
+_BOLLINGER_KEYS = frozenset({"bb_high", "bb_low", "bb_mavg"})
+
+# Bars required before each indicator is meaningful; shorter histories skip it.
+# Also fixes the key order of the result.
+_MIN_BARS: Dict[str, int] = {
+    "sma_20": 20,
+    "sma_50": 50,
+    "rsi_14": 14,
+    "atr_14": 14,
+    "macd": 26,
+    "macd_signal": 26,
+    "macd_diff": 26,
+    "bb_high": 20,
+    "bb_low": 20,
+    "bb_mavg": 20,
+}
+
+
+def compute_indicators(history: pd.DataFrame, only: Optional[Iterable[str]] = None) -> Dict[str, pd.Series]:
+    """Compute a collection of standard technical indicators.
+
+    ``only`` restricts the result to the named indicators (e.g. ``{"atr_14"}``)
+    so callers skip series they never read; ``None`` computes everything.
+    Indicators whose window is longer than the history are not computed and
+    come back as all-NaN series so the result keys stay stable.
+    """
+
+    if history.empty:
+        return {}
+
+    wanted = None if only is None else frozenset(only)
+    keys = [key for key in _MIN_BARS if wanted is None or key in wanted]
+    bars = len(history)
+    ready = frozenset(key for key in keys if bars >= _MIN_BARS[key])
+
+    def want(*names: str) -> bool:
+        return any(name in ready for name in names)
+
+    def finish(indicators: Dict[str, pd.Series]) -> Dict[str, pd.Series]:
+        return {
+            key: indicators[key] if key in ready else pd.Series(np.nan, index=history.index, name=key)
+            for key in keys
+        }
+
+    if not ready:
+        return finish({})
+
+    close = _as_float(history["Close"])
+
+    fused = _compute_fused(history, close)
+    if fused is not None:
+        # The fused kernel produces every series in one pass anyway.
+        return finish(fused)
+
+    indicators: Dict[str, pd.Series] = {}
+    if want("sma_20"):
+        indicators["sma_20"] = close.rolling(window=20, min_periods=0).mean().rename("sma_20")
+    if want("sma_50"):
+        indicators["sma_50"] = close.rolling(window=50, min_periods=0).mean().rename("sma_50")
+    if want("rsi_14"):
+        indicators["rsi_14"] = _rsi(close, 14)
+
+    if want("atr_14"):
+        indicators["atr_14"] = _atr(
+            _as_float(history["High"]),
+            _as_float(history["Low"]),
+            close,
+            14,
+        )
+
+    if want(*_MACD_KEYS):
+        macd = _ema(close, 12) - _ema(close, 26)
+        macd_signal = _ema(macd, 9)
+        indicators.update(
+            {
+                "macd": _fill_gaps(macd, 0).rename("MACD_12_26"),
+                "macd_signal": _fill_gaps(macd_signal, 0).rename("MACD_sign_12_26"),
+                "macd_diff": _fill_gaps(macd - macd_signal, 0).rename("MACD_diff_12_26"),
+            }
+        )
+
+    if want(*_BOLLINGER_KEYS):
+        rolling = close.rolling(20, min_periods=0)
+        bb_mavg = rolling.mean()
+        bb_std = rolling.std(ddof=0)
+        indicators.update(
+            {
+                "bb_high": _fill_gaps(bb_mavg + 2.0 * bb_std, None).rename("hband"),
+                "bb_low": _fill_gaps(bb_mavg - 2.0 * bb_std, None).rename("lband"),
+                "bb_mavg": _fill_gaps(bb_mavg, None).rename("mavg"),
+            }
+        )
+
+    return finish(indicators)
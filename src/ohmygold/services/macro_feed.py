@@ -2,27 +2,31 @@
 
 from __future__ import annotations
 
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Placeholder highlights until a macro data provider is wired in.
+_MACRO_HIGHLIGHTS: Tuple[Dict[str, str], ...] = (
+    {
+        "headline": "Real yields stay elevated",
+        "impact": "watch",
+        "implication": "Higher real rates cap upside unless growth fears rise",
+    },
+    {
+        "headline": "USD strength persists post data",
+        "impact": "bearish",
+        "implication": "Short-term pressure on gold until dollar momentum cools",
+    },
+)
+
 
 def collect_macro_highlights() -> List[Dict[str, str]]:
     """Fetch or compose macroeconomic highlights relevant to gold."""
 
     # Placeholder implementation. Replace with calls to macro data providers.
     logger.info("获取宏观摘要")
-    return [
-        {
-            "headline": "Real yields stay elevated",
-            "impact": "watch",
-            "implication": "Higher real rates cap upside unless growth fears rise",
-        },
-        {
-            "headline": "USD strength persists post data",
-            "impact": "bearish",
-            "implication": "Short-term pressure on gold until dollar momentum cools",
-        },
-    ]
+    # Callers embed these in mutable context payloads, so hand out copies.
+    return [dict(highlight) for highlight in _MACRO_HIGHLIGHTS]
@@ -4,10 +4,15 @@ from __future__ import annotations
 
 import math
 import tempfile
+import threading
 import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -23,25 +28,36 @@ except ImportError:  # pragma: no cover - dependency enforced via pyproject
 from ..config.settings import get_settings
 from ..utils.logging import get_logger
 from ..utils.serialization import df_to_records
-from .data_providers import (
-    AlphaVantageFXAdapter,
-    CacheConfig,
-    DataSourceAdapter,
-    IBKRAdapter,
-    PolygonAdapter,
-    RetryConfig,
-    TanshuGoldAdapter,
-    TwelveDataAdapter,
-    YahooFinanceAdapter,
-)
+from . import data_providers
+from .data_providers import CacheConfig, DataSourceAdapter, RetryConfig
+from .data_providers.base import resolve_price_dtype
 from .data_router import DataSourceRouter
 from .exceptions import DataProviderError, DataStalenessError
 from .indicators import compute_indicators
 
 logger = get_logger(__name__)
 
-_CACHE_SESSION: Optional[Session] = None
-_CACHE_SETTINGS: Dict[str, Any] = {}
+# Extra calendar days requested beyond the weekend-adjusted window.
+_HOLIDAY_BUFFER_DAYS = 4
+
+# Short-lived in-process cache so latest_quote/price_history_payload/
+# market_snapshot calls for the same symbol within a workflow round share one
+# provider round-trip. Entries map key -> (expires_at_monotonic, frame).
+_HISTORY_TTL_SECONDS = 60.0
+_HISTORY_CACHE_MAXSIZE = 64
+_HISTORY_CACHE: Dict[Tuple[str, int, str, str], Tuple[float, pd.DataFrame]] = {}
+_HISTORY_CACHE_LOCK = threading.Lock()
+# latest_quote fast-path results, keyed (symbol, mode, provider) -> (expires_at, price).
+_QUOTE_CACHE: Dict[Tuple[str, str, str], Tuple[float, float]] = {}
+
+_OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
+
+# OHLC columns narrowed when ``market_data_precision`` asks for float32;
+# Volume stays float64 because of its magnitude.
+_PRICE_COLUMNS = ("Open", "High", "Low", "Close", "Adj Close")
+
+# Upper bound on concurrent symbol downloads in fetch_price_histories.
+_MAX_FETCH_WORKERS = 8
 
 
 def effective_max_age_minutes(settings) -> int:
@@ -80,17 +96,16 @@ def _cache_path() -> str:
 def _cached_session(settings) -> Optional[Session]:
     if requests_cache is None:
         return None
+    return _build_cached_session(
+        settings.market_data_cache_minutes,
+        settings.market_data_retry_total,
+        settings.market_data_retry_backoff,
+    )
 
-    global _CACHE_SESSION, _CACHE_SETTINGS
-    config_key = {
-        "expire": settings.market_data_cache_minutes,
-        "retry_total": settings.market_data_retry_total,
-        "retry_backoff": settings.market_data_retry_backoff,
-    }
-    if _CACHE_SESSION is not None and _CACHE_SETTINGS == config_key:
-        return _CACHE_SESSION
 
-    expire_after = timedelta(minutes=settings.market_data_cache_minutes)
+@lru_cache(maxsize=1)
+def _build_cached_session(cache_minutes: int, retry_total: int, retry_backoff: float) -> Session:
+    expire_after = timedelta(minutes=cache_minutes)
     session = requests_cache.CachedSession(
         cache_name=_cache_path(),
         backend="sqlite",
@@ -98,8 +113,8 @@ def _cached_session(settings) -> Optional[Session]:
         ignored_parameters=["_ts"],
     )
     retry = Retry(
-        total=settings.market_data_retry_total,
-        backoff_factor=settings.market_data_retry_backoff,
+        total=retry_total,
+        backoff_factor=retry_backoff,
         status_forcelist=(429, 500, 502, 503, 504),
         allowed_methods=frozenset({"GET", "HEAD"}),
         respect_retry_after_header=True,
@@ -107,36 +122,52 @@ def _cached_session(settings) -> Optional[Session]:
     adapter = HTTPAdapter(max_retries=retry)
     session.mount("https://", adapter)
     session.mount("http://", adapter)
-    _CACHE_SESSION = session
-    _CACHE_SETTINGS = config_key
     return session
 
 
+@lru_cache(maxsize=8)
+def _mock_business_days(periods: int, end_ordinal: int) -> pd.DatetimeIndex:
+    """Naive business-day index ending on the UTC date ``end_ordinal``.
+
+    Keyed on the date so repeated mocks within a day share one (immutable)
+    index; the key rotates at midnight UTC.
+    """
+
+    return pd.bdate_range(end=datetime.fromordinal(end_ordinal), periods=periods)
+
+
 def _mock_price_history(symbol: str, days: int) -> pd.DataFrame:
     periods = max(days, 30)
-    now_utc = datetime.now(timezone.utc)
-    idx = pd.bdate_range(end=now_utc, periods=periods, tz="UTC").tz_localize(None)
-    seed = abs(hash(symbol)) % (2**32)
+    idx = _mock_business_days(periods, datetime.now(timezone.utc).date().toordinal())
+    # crc32 is stable across processes (unlike str hash) and already fits uint32.
+    seed = zlib.crc32(symbol.encode("utf-8"))
     rng = np.random.default_rng(seed)
     base_price = 1850 + (seed % 200) * 0.5
     drift = rng.normal(0.05, 0.02)
-    shocks = rng.normal(0, 1.8, size=len(idx))
-    closes = base_price + np.cumsum(drift + shocks)
-    highs = closes + np.abs(rng.normal(1.2, 0.6, size=len(idx)))
-    lows = closes - np.abs(rng.normal(1.3, 0.5, size=len(idx)))
-    opens = closes + rng.normal(0, 0.8, size=len(idx))
-    volumes = np.full(len(idx), 100_000 + int(seed % 50_000))
-    data = pd.DataFrame(
-        {
-            "Open": opens,
-            "High": highs,
-            "Low": lows,
-            "Close": closes,
-            "Adj Close": closes,
-            "Volume": volumes,
-        },
-        index=idx,
-    )
+    # One draw for all four noise rows: close shocks, high/low offsets, open noise.
+    noise = rng.standard_normal((4, len(idx)))
+    shocks, high_noise, low_noise, open_noise = noise
+    # Fill one column-major float64 block in place so the frame wraps a single
+    # contiguous buffer instead of consolidating six separate arrays.
+    block = np.empty((len(idx), len(_OHLCV_COLUMNS)), dtype=np.float64, order="F")
+    opens, highs, lows, closes, adj_closes, volumes = block.T
+    np.multiply(shocks, 1.8, out=shocks)
+    np.add(shocks, drift, out=shocks)
+    np.cumsum(shocks, out=closes)
+    closes += base_price
+    np.multiply(high_noise, 0.6, out=highs)
+    highs += 1.2
+    np.abs(highs, out=highs)
+    highs += closes
+    np.multiply(low_noise, 0.5, out=lows)
+    lows += 1.3
+    np.abs(lows, out=lows)
+    np.subtract(closes, lows, out=lows)
+    np.multiply(open_noise, 0.8, out=opens)
+    opens += closes
+    adj_closes[:] = closes
+    volumes.fill(100_000 + int(seed % 50_000))
+    data = pd.DataFrame(block, index=idx, columns=_OHLCV_COLUMNS, copy=False)
     data.index.name = "Date"
     logger.warning("使用模拟行情：%s（%d天）", symbol, days)
     return data.tail(days)
@@ -149,7 +180,13 @@ def _retry_fetch(
     provider_label: str,
     settings,
 ) -> pd.DataFrame:
-    attempts = max(1, settings.market_data_retry_total + 1)
+    """Run ``fetcher``, retrying once on unexpected (non-provider) errors.
+
+    HTTP status and connection retries already happen inside the sessions'
+    urllib3 ``Retry``; looping here as well would multiply them.
+    """
+
+    attempts = 2 if settings.market_data_retry_total > 0 else 1
     last_error: Optional[Exception] = None
 
     for attempt in range(1, attempts + 1):
@@ -159,7 +196,6 @@ def _retry_fetch(
             raise
         except Exception as exc:  # pragma: no cover - exercised via live fetch in integration runs
             last_error = exc
-            wait_seconds = max(0.0, settings.market_data_retry_backoff) * math.pow(2, attempt - 1)
             logger.warning(
                 "行情抓取失败（第%d/%d次，标的=%s，来源=%s）：%s",
                 attempt,
@@ -168,8 +204,9 @@ def _retry_fetch(
                 provider_label,
                 exc,
             )
+            wait_seconds = min(max(0.0, settings.market_data_retry_backoff), 30)
             if attempt < attempts and wait_seconds:
-                time.sleep(min(wait_seconds, 30))
+                time.sleep(wait_seconds)
 
     raise DataProviderError(
         f"多次尝试后仍无法获取行情 {symbol}（来源 {provider_label}）：{last_error}"
@@ -182,28 +219,38 @@ def _ensure_freshness(history: pd.DataFrame, *, max_age_minutes: int) -> Optiona
     if history.empty:
         history.attrs.setdefault("data_age_minutes", None)
         return None
-    last_index = history.index.max()
-    if last_index is None:
-        history.attrs.setdefault("data_age_minutes", None)
-        return None
-    if isinstance(last_index, pd.Timestamp):
-        last_dt = last_index.to_pydatetime()
-    else:
-        last_dt = datetime.fromisoformat(str(last_index))
+    index = history.index
     now_utc = datetime.now(timezone.utc)
-    if last_dt.tzinfo is None:
-        last_dt = last_dt.replace(tzinfo=timezone.utc)
+    if isinstance(index, pd.DatetimeIndex) and index.tz is None and index.is_monotonic_increasing:
+        # Fast path for the normal naive-UTC, sorted index: stay in datetime64
+        # rather than boxing Timestamps for max() and the subtraction.
+        last_value = index.to_numpy()[-1].astype("datetime64[us]")
+        now_value = np.datetime64(now_utc.replace(tzinfo=None), "us")
+        age_seconds = float((now_value - last_value) / np.timedelta64(1, "s"))
+        last_iso = last_value.item().replace(tzinfo=timezone.utc).isoformat()
     else:
-        last_dt = last_dt.astimezone(timezone.utc)
-    age = now_utc - last_dt
-    age_minutes = age.total_seconds() / 60 if age else 0.0
+        last_index = index.max()
+        if last_index is None:
+            history.attrs.setdefault("data_age_minutes", None)
+            return None
+        if isinstance(last_index, pd.Timestamp):
+            last_dt = last_index.to_pydatetime()
+        else:
+            last_dt = datetime.fromisoformat(str(last_index))
+        if last_dt.tzinfo is None:
+            last_dt = last_dt.replace(tzinfo=timezone.utc)
+        else:
+            last_dt = last_dt.astimezone(timezone.utc)
+        age_seconds = (now_utc - last_dt).total_seconds()
+        last_iso = last_dt.isoformat()
+    age_minutes = age_seconds / 60
 
-    history.attrs["data_last_timestamp"] = last_dt.isoformat()
+    history.attrs["data_last_timestamp"] = last_iso
     history.attrs["data_age_minutes"] = age_minutes
 
-    if age > timedelta(minutes=max_age_minutes):
+    if age_minutes > max_age_minutes:
         raise DataStalenessError(
-            f"最新行情已经超过{int(age.total_seconds() // 60)}分钟（上限{max_age_minutes}分钟）"
+            f"最新行情已经超过{int(age_seconds // 60)}分钟（上限{max_age_minutes}分钟）"
         )
     return age_minutes
 
@@ -212,36 +259,89 @@ def _normalized_provider(value: Optional[str]) -> str:
     return (value or "yfinance").lower().strip()
 
 
-def _instantiate_adapter(provider_key: str, settings) -> Optional[Tuple[DataSourceAdapter, str]]:
+def _frozen_map(mapping: Optional[Dict[str, str]]) -> Tuple[Tuple[str, str], ...]:
+    return tuple(sorted((mapping or {}).items()))
+
+
+@dataclass(frozen=True)
+class _ProviderConfig:
+    """Hashable snapshot of the settings that shape adapter construction."""
+
+    tanshu_api_key: Optional[str]
+    tanshu_endpoint: str
+    tanshu_symbol_map: Tuple[Tuple[str, str], ...]
+    tanshu_symbol_code: Optional[str]
+    twelve_data_api_key: Optional[str]
+    twelve_data_base_url: str
+    twelve_data_symbol_map: Tuple[Tuple[str, str], ...]
+    twelve_data_symbol: Optional[str]
+    alpha_vantage_api_key: Optional[str]
+    polygon_api_key: Optional[str]
+    polygon_base_url: str
+    polygon_symbol_map: Tuple[Tuple[str, str], ...]
+    market_data_precision: str
+
+    @classmethod
+    def from_settings(cls, settings) -> "_ProviderConfig":
+        return cls(
+            tanshu_api_key=settings.tanshu_api_key,
+            tanshu_endpoint=settings.tanshu_endpoint,
+            tanshu_symbol_map=_frozen_map(settings.tanshu_symbol_map),
+            tanshu_symbol_code=settings.tanshu_symbol_code,
+            twelve_data_api_key=settings.twelve_data_api_key,
+            twelve_data_base_url=settings.twelve_data_base_url,
+            twelve_data_symbol_map=_frozen_map(settings.twelve_data_symbol_map),
+            twelve_data_symbol=settings.twelve_data_symbol,
+            alpha_vantage_api_key=settings.alpha_vantage_api_key,
+            polygon_api_key=settings.polygon_api_key,
+            polygon_base_url=settings.polygon_base_url,
+            polygon_symbol_map=_frozen_map(settings.polygon_symbol_map),
+            market_data_precision=settings.market_data_precision,
+        )
+
+
+@lru_cache(maxsize=32)
+def _instantiate_adapter(provider_key: str, config: _ProviderConfig) -> Optional[Tuple[DataSourceAdapter, str]]:
+    """Build (and memoise) the adapter for ``provider_key``.
+
+    Adapters keep their pooled sessions and symbol lookups, so reusing them
+    across fetches avoids rebuilding both; a settings change yields a new
+    ``config`` and therefore fresh adapters.
+    """
+
     try:
         if provider_key in {"yfinance", "yahoo"}:
-            return YahooFinanceAdapter(), "Yahoo Finance"
+            return data_providers.YahooFinanceAdapter(), "Yahoo Finance"
         if provider_key in {"tanshu", "tanshuapi", "tanshu_gold", "tanshu-gold"}:
-            adapter = TanshuGoldAdapter(
-                settings.tanshu_api_key,
-                endpoint=settings.tanshu_endpoint,
-                symbol_map=settings.tanshu_symbol_map,
-                default_symbol_code=settings.tanshu_symbol_code,
+            adapter = data_providers.TanshuGoldAdapter(
+                config.tanshu_api_key,
+                endpoint=config.tanshu_endpoint,
+                symbol_map=dict(config.tanshu_symbol_map),
+                default_symbol_code=config.tanshu_symbol_code,
             )
             return adapter, "探数黄金"
         if provider_key in {"twelvedata", "twelve_data", "12data", "twelve"}:
-            adapter = TwelveDataAdapter(
-                settings.twelve_data_api_key,
-                base_url=settings.twelve_data_base_url,
-                symbol_map=settings.twelve_data_symbol_map,
-                default_symbol=settings.twelve_data_symbol,
+            adapter = data_providers.TwelveDataAdapter(
+                config.twelve_data_api_key,
+                base_url=config.twelve_data_base_url,
+                symbol_map=dict(config.twelve_data_symbol_map),
+                default_symbol=config.twelve_data_symbol,
             )
             return adapter, "Twelve Data"
         if provider_key in {"alpha_vantage", "alphavantage", "alpha-vantage", "alpha"}:
-            adapter = AlphaVantageFXAdapter(settings.alpha_vantage_api_key)
+            adapter = data_providers.AlphaVantageFXAdapter(
+                config.alpha_vantage_api_key,
+                precision=config.market_data_precision,
+            )
             return adapter, "Alpha Vantage"
         if provider_key in {"ibkr", "interactivebrokers"}:
-            return IBKRAdapter(), "IBKR"
+            return data_providers.IBKRAdapter(), "IBKR"
         if provider_key in {"polygon", "polygon.io"}:
-            adapter = PolygonAdapter(
-                settings.polygon_api_key,
-                base_url=settings.polygon_base_url,
-                symbol_map=settings.polygon_symbol_map,
+            adapter = data_providers.PolygonAdapter(
+                config.polygon_api_key,
+                base_url=config.polygon_base_url,
+                symbol_map=dict(config.polygon_symbol_map),
+                precision=config.market_data_precision,
             )
             return adapter, "Polygon.io"
     except DataProviderError as exc:
@@ -257,51 +357,54 @@ def _instantiate_adapter(provider_key: str, settings) -> Optional[Tuple[DataSour
     return None
 
 
-def _build_provider_chain(settings) -> List[Tuple[str, DataSourceAdapter, str]]:
-    primary = _normalized_provider(settings.data_provider)
-    chain: List[Tuple[str, DataSourceAdapter, str]] = []
-    seen: set[str] = set()
-
-    def add(provider: str) -> None:
-        key = _normalized_provider(provider)
-        if key in seen:
-            return
-        entry = _instantiate_adapter(key, settings)
-        if entry is None:
-            return
-        chain.append((key, entry[0], entry[1]))
-        seen.add(key)
-
-    add(primary)
-
-    fallback_matrix = {
-        "yfinance": ["polygon", "twelvedata", "tanshu", "alpha_vantage"],
-        "yahoo": ["polygon", "twelvedata", "tanshu", "alpha_vantage"],
-        "tanshu": ["polygon", "twelvedata", "yfinance", "alpha_vantage"],
-        "tanshuapi": ["polygon", "twelvedata", "yfinance", "alpha_vantage"],
-        "tanshu_gold": ["polygon", "twelvedata", "yfinance", "alpha_vantage"],
-        "tanshu-gold": ["polygon", "twelvedata", "yfinance", "alpha_vantage"],
-        "twelvedata": ["polygon", "yfinance", "tanshu", "alpha_vantage"],
-        "twelve_data": ["polygon", "yfinance", "tanshu", "alpha_vantage"],
-        "12data": ["polygon", "yfinance", "tanshu", "alpha_vantage"],
-        "twelve": ["polygon", "yfinance", "tanshu", "alpha_vantage"],
-        "alpha_vantage": ["polygon", "twelvedata", "tanshu", "yfinance"],
-        "alphavantage": ["polygon", "twelvedata", "tanshu", "yfinance"],
-        "alpha-vantage": ["polygon", "twelvedata", "tanshu", "yfinance"],
-        "alpha": ["polygon", "twelvedata", "tanshu", "yfinance"],
-        "ibkr": ["polygon", "twelvedata", "tanshu", "yfinance", "alpha_vantage"],
-        "interactivebrokers": ["polygon", "twelvedata", "tanshu", "yfinance", "alpha_vantage"],
-        "polygon": ["twelvedata", "yfinance", "alpha_vantage", "tanshu"],
-        "polygon.io": ["twelvedata", "yfinance", "alpha_vantage", "tanshu"],
-    }
+# Fallback providers tried after each primary, in order.
+_FALLBACK_MATRIX: Dict[str, Tuple[str, ...]] = {
+    "yfinance": ("polygon", "twelvedata", "tanshu", "alpha_vantage"),
+    "yahoo": ("polygon", "twelvedata", "tanshu", "alpha_vantage"),
+    "tanshu": ("polygon", "twelvedata", "yfinance", "alpha_vantage"),
+    "tanshuapi": ("polygon", "twelvedata", "yfinance", "alpha_vantage"),
+    "tanshu_gold": ("polygon", "twelvedata", "yfinance", "alpha_vantage"),
+    "tanshu-gold": ("polygon", "twelvedata", "yfinance", "alpha_vantage"),
+    "twelvedata": ("polygon", "yfinance", "tanshu", "alpha_vantage"),
+    "twelve_data": ("polygon", "yfinance", "tanshu", "alpha_vantage"),
+    "12data": ("polygon", "yfinance", "tanshu", "alpha_vantage"),
+    "twelve": ("polygon", "yfinance", "tanshu", "alpha_vantage"),
+    "alpha_vantage": ("polygon", "twelvedata", "tanshu", "yfinance"),
+    "alphavantage": ("polygon", "twelvedata", "tanshu", "yfinance"),
+    "alpha-vantage": ("polygon", "twelvedata", "tanshu", "yfinance"),
+    "alpha": ("polygon", "twelvedata", "tanshu", "yfinance"),
+    "ibkr": ("polygon", "twelvedata", "tanshu", "yfinance", "alpha_vantage"),
+    "interactivebrokers": ("polygon", "twelvedata", "tanshu", "yfinance", "alpha_vantage"),
+    "polygon": ("twelvedata", "yfinance", "alpha_vantage", "tanshu"),
+    "polygon.io": ("twelvedata", "yfinance", "alpha_vantage", "tanshu"),
+}
+_DEFAULT_FALLBACKS: Tuple[str, ...] = ("polygon", "twelvedata", "tanshu", "alpha_vantage", "yfinance")
+# Common fallbacks appended so each is considered even if not listed explicitly.
+_COMMON_FALLBACKS: Tuple[str, ...] = ("polygon", "twelvedata", "alpha_vantage", "tanshu", "yfinance")
+
+
+def _candidate_chain(primary: str, fallbacks: Tuple[str, ...]) -> Tuple[str, ...]:
+    # dict.fromkeys keeps first-seen order while dropping duplicates.
+    return tuple(dict.fromkeys((primary, *fallbacks, *_COMMON_FALLBACKS)))
+
+
+_FALLBACK_CHAINS: Dict[str, Tuple[str, ...]] = {
+    primary: _candidate_chain(primary, fallbacks) for primary, fallbacks in _FALLBACK_MATRIX.items()
+}
 
-    fallback_candidates = fallback_matrix.get(primary, ["polygon", "twelvedata", "tanshu", "alpha_vantage", "yfinance"])
 
-    # Ensure we consider common fallbacks even if not listed explicitly.
-    fallback_candidates = list(fallback_candidates) + ["polygon", "twelvedata", "alpha_vantage", "tanshu", "yfinance"]
+def _build_provider_chain(settings) -> List[Tuple[str, DataSourceAdapter, str]]:
+    primary = _normalized_provider(settings.data_provider)
+    candidates = _FALLBACK_CHAINS.get(primary)
+    if candidates is None:
+        candidates = _candidate_chain(primary, _DEFAULT_FALLBACKS)
+    config = _ProviderConfig.from_settings(settings)
 
-    for candidate in fallback_candidates:
-        add(candidate)
+    chain: List[Tuple[str, DataSourceAdapter, str]] = []
+    for key in candidates:
+        entry = _instantiate_adapter(key, config)
+        if entry is not None:
+            chain.append((key, entry[0], entry[1]))
 
     if not chain:
         raise DataProviderError(f"不支持的数据源：{settings.data_provider}")
@@ -346,10 +449,72 @@ def _attempt_fetch_with_logging(
     return data, None
 
 
+def _history_window_days(days: int) -> int:
+    """Calendar days to request so that ``days`` trading sessions are covered.
+
+    Five sessions per seven calendar days, plus slack for market holidays.
+    """
+
+    return math.ceil(max(days, 1) * 7 / 5) + _HOLIDAY_BUFFER_DAYS
+
+
+def _evict_history_cache(now: float) -> None:
+    expired = [key for key, (expires_at, _) in _HISTORY_CACHE.items() if expires_at <= now]
+    for key in expired:
+        del _HISTORY_CACHE[key]
+    if len(_HISTORY_CACHE) >= _HISTORY_CACHE_MAXSIZE:
+        # Dicts keep insertion order, so the first entry is the oldest.
+        del _HISTORY_CACHE[next(iter(_HISTORY_CACHE))]
+
+
 def fetch_price_history(symbol: str, days: int = 14) -> pd.DataFrame:
-    """Fetch recent price history using the configured data adapter."""
+    """Fetch recent price history using the configured data adapter.
+
+    Live results are reused for ``_HISTORY_TTL_SECONDS``; callers always
+    receive their own copy, so mutating the returned frame is safe.
+    """
 
     settings = get_settings()
+    key = (
+        symbol,
+        int(days),
+        (settings.data_mode or "live").lower(),
+        _normalized_provider(settings.data_provider),
+    )
+    now = time.monotonic()
+    with _HISTORY_CACHE_LOCK:
+        cached = _HISTORY_CACHE.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1].copy()
+
+    data = _fetch_price_history_uncached(symbol, days, settings)
+    # Only cache real provider data; mock/empty fallbacks should be retried.
+    if not data.empty and data.attrs.get("provider_key"):
+        with _HISTORY_CACHE_LOCK:
+            if len(_HISTORY_CACHE) >= _HISTORY_CACHE_MAXSIZE:
+                _evict_history_cache(now)
+            _HISTORY_CACHE[key] = (now + _HISTORY_TTL_SECONDS, data.copy())
+    return data
+
+
+def fetch_price_histories(symbols: Iterable[str], days: int = 14) -> Dict[str, pd.DataFrame]:
+    """Fetch several symbols concurrently via :func:`fetch_price_history`.
+
+    Downloads are network-bound, so wall time tracks the slowest symbol rather
+    than the sum. Duplicate symbols are fetched once; the first provider error
+    propagates as it would from sequential calls.
+    """
+
+    unique = list(dict.fromkeys(symbols))
+    if len(unique) <= 1:
+        return {symbol: fetch_price_history(symbol, days=days) for symbol in unique}
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_FETCH_WORKERS, len(unique))) as executor:
+        frames = executor.map(lambda symbol: fetch_price_history(symbol, days=days), unique)
+        return dict(zip(unique, frames))
+
+
+def _fetch_price_history_uncached(symbol: str, days: int, settings) -> pd.DataFrame:
     mode = (settings.data_mode or "live").lower()
 
     if mode not in {"live", "hybrid", "mock"}:
@@ -360,7 +525,7 @@ def fetch_price_history(symbol: str, days: int = 14) -> pd.DataFrame:
         return _mock_price_history(symbol, days)
 
     end = datetime.now(timezone.utc)
-    start = end - timedelta(days=days * 2)
+    start = end - timedelta(days=_history_window_days(days))
     session = _cached_session(settings)
 
     provider_chain = _build_provider_chain(settings)
@@ -416,11 +581,15 @@ def fetch_price_history(symbol: str, days: int = 14) -> pd.DataFrame:
             return _mock_price_history(symbol, days)
         if error:
             logger.error("行情抓取失败：%s", error)
-        return pd.DataFrame(columns=["Open", "High", "Low", "Close", "Adj Close", "Volume"])
+        return pd.DataFrame(columns=_OHLCV_COLUMNS)
 
     attrs_snapshot = dict(getattr(data, "attrs", {}))
     data = data.tail(days)
     data.index = pd.to_datetime(data.index)
+    price_dtype = resolve_price_dtype(settings.market_data_precision)
+    if price_dtype != np.float64:
+        price_columns = [column for column in _PRICE_COLUMNS if column in data.columns]
+        data[price_columns] = data[price_columns].astype(price_dtype, copy=False)
     data.attrs.update(attrs_snapshot)
     max_age_minutes = effective_max_age_minutes(settings)
     age_minutes = _ensure_freshness(data, max_age_minutes=max_age_minutes)
@@ -434,8 +603,42 @@ def fetch_price_history(symbol: str, days: int = 14) -> pd.DataFrame:
     return data
 
 
+def _fetch_latest_quote(symbol: str, settings) -> Optional[float]:
+    """Ask the primary adapter for a scalar quote; ``None`` when unavailable."""
+
+    try:
+        adapter = _build_provider_chain(settings)[0][1]
+        quote = adapter.fetch_latest(symbol, session=_cached_session(settings))
+    except Exception as exc:
+        logger.debug("快速报价失败，改用历史行情：%s（%s）", symbol, exc)
+        return None
+    return quote if quote is not None and math.isfinite(quote) else None
+
+
 def latest_quote(symbol: str) -> Optional[float]:
-    """Return the latest close price for quick status updates."""
+    """Return the latest close price for quick status updates.
+
+    Live modes first ask the primary adapter for a scalar quote (cached for
+    ``_HISTORY_TTL_SECONDS``) and skip the freshness check; the full
+    :func:`fetch_price_history` path with fallbacks is used when that fails.
+    """
+
+    settings = get_settings()
+    mode = (settings.data_mode or "live").lower()
+    if mode != "mock":
+        key = (symbol, mode, _normalized_provider(settings.data_provider))
+        now = time.monotonic()
+        with _HISTORY_CACHE_LOCK:
+            cached = _QUOTE_CACHE.get(key)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+        quote = _fetch_latest_quote(symbol, settings)
+        if quote is not None:
+            with _HISTORY_CACHE_LOCK:
+                if len(_QUOTE_CACHE) >= _HISTORY_CACHE_MAXSIZE:
+                    _QUOTE_CACHE.clear()
+                _QUOTE_CACHE[key] = (now + _HISTORY_TTL_SECONDS, quote)
+            return quote
 
     history = fetch_price_history(symbol, days=1)
     if history.empty:
@@ -455,15 +658,29 @@ def price_history_payload(symbol: str, days: int = 14) -> Dict[str, Any]:
     }
 
 
-def market_snapshot(symbol: str, days: int = 30) -> Dict[str, Any]:
-    """Return key market metrics such as latest price and volatility."""
+def market_snapshot(
+    symbol: str,
+    days: int = 30,
+    *,
+    history: Optional[pd.DataFrame] = None,
+    indicators: Optional[Dict[str, pd.Series]] = None,
+) -> Dict[str, Any]:
+    """Return key market metrics such as latest price and volatility.
+
+    Callers that already hold the price ``history`` (and optionally its
+    ``indicators``) can pass them in to skip the fetch and ATR computation.
+    """
 
-    history = fetch_price_history(symbol, days=days)
-    indicators = compute_indicators(history)
+    if history is None:
+        history = fetch_price_history(symbol, days=days)
+    if indicators is None:
+        indicators = compute_indicators(history, only={"atr_14"})
     latest_close = float(history["Close"].iloc[-1]) if not history.empty else None
 
     atr_series = indicators.get("atr_14")
     atr_latest = float(atr_series.iloc[-1]) if atr_series is not None and not atr_series.empty else None
+    if atr_latest is not None and math.isnan(atr_latest):
+        atr_latest = None
 
     return {
         "symbol": symbol,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from dataclasses import dataclass
@@ -447,7 +448,14 @@ def collect_news_articles(
     return ordered_articles
 
 
+async def collect_news_articles_async(symbol: str, **kwargs: Any) -> List[NewsArticle]:
+    """Run :func:`collect_news_articles` in a worker thread for use with asyncio."""
+
+    return await asyncio.to_thread(collect_news_articles, symbol, **kwargs)
+
+
 __all__ = [
     "NewsArticle",
     "collect_news_articles",
+    "collect_news_articles_async",
 ]
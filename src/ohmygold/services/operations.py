@@ -3,59 +3,52 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# (category, task descriptions) for the end-of-day checklist; every task
+# starts out pending.
+_CHECKLIST_SECTIONS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    (
+        "cash_and_margin",
+        (
+            "Reconcile futures margin with clearing broker",
+            "Authorize cash movements for OTC counterparties",
+        ),
+    ),
+    (
+        "documentation",
+        (
+            "Match trade confirmations against blotter",
+            "Archive compliance-approved voice logs",
+        ),
+    ),
+    (
+        "logistics",
+        (
+            "Confirm vault inventory levels",
+            "Schedule transport for any spot deliveries",
+        ),
+    ),
+)
+
 
 def build_settlement_checklist(symbol: str) -> Dict[str, List[str]]:
     """Return end-of-day tasks for the settlement and logistics teams."""
 
     logger.info("生成结算清单：%s", symbol)
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    # Task statuses are updated downstream, so each call gets fresh dicts.
     return {
         "date": today,
         "sections": [
             {
-                "category": "cash_and_margin",
-                "tasks": [
-                    {
-                        "description": "Reconcile futures margin with clearing broker",
-                        "status": "pending",
-                    },
-                    {
-                        "description": "Authorize cash movements for OTC counterparties",
-                        "status": "pending",
-                    },
-                ],
-            },
-            {
-                "category": "documentation",
-                "tasks": [
-                    {
-                        "description": "Match trade confirmations against blotter",
-                        "status": "pending",
-                    },
-                    {
-                        "description": "Archive compliance-approved voice logs",
-                        "status": "pending",
-                    },
-                ],
-            },
-            {
-                "category": "logistics",
-                "tasks": [
-                    {
-                        "description": "Confirm vault inventory levels",
-                        "status": "pending",
-                    },
-                    {
-                        "description": "Schedule transport for any spot deliveries",
-                        "status": "pending",
-                    },
-                ],
-            },
+                "category": category,
+                "tasks": [{"description": description, "status": "pending"} for description in descriptions],
+            }
+            for category, descriptions in _CHECKLIST_SECTIONS
         ],
     }
@@ -2,20 +2,24 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from math import isnan
-from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, TYPE_CHECKING
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
 
 from ..utils.logging import get_logger
 from .market_data import fetch_price_history
-from .risk_math import ScenarioShock, apply_scenario, historical_var, rolling_correlation
-
-if TYPE_CHECKING:  # pragma: no cover - type checker assistance only
-    import pandas as pd
+from .risk_math import ScenarioShock, apply_scenario, realized_return_stats
 
 logger = get_logger(__name__)
 
+# Upper bound on concurrent benchmark downloads in _fetch_benchmark_series.
+_MAX_BENCHMARK_WORKERS = 8
+
 
 @dataclass
 class RiskLimits:
@@ -113,6 +117,12 @@ def adjust_limits_with_news(
     return adjusted, adjustment_meta
 
 
+def _as_float_series(values: "pd.Series") -> "pd.Series":
+    """Return ``values`` as float64, skipping the conversion when already float64."""
+
+    return values if values.dtype == "float64" else values.astype(float)
+
+
 def _fetch_benchmark_series(
     targets: Sequence[CorrelationTarget],
     *,
@@ -120,89 +130,113 @@ def _fetch_benchmark_series(
 ) -> Dict[str, "pd.Series"]:
     """Download benchmark closes for correlation diagnostics."""
 
-    from importlib import import_module
-
     benchmark_series: Dict[str, "pd.Series"] = {}
-    try:  # pragma: no cover - keep pandas optional
-        pd = import_module("pandas")
-    except ModuleNotFoundError:
+    symbols = list(dict.fromkeys(target.symbol for target in targets))
+    if not symbols:
         return benchmark_series
 
-    for target in targets:
+    def fetch(symbol: str) -> Optional["pd.DataFrame"]:
         try:
-            history = fetch_price_history(target.symbol, days=lookback_days)
+            return fetch_price_history(symbol, days=lookback_days)
         except Exception as exc:  # pragma: no cover - defensive logging
-            logger.warning("基准行情下载失败：%s（%s）", target.symbol, exc)
+            logger.warning("基准行情下载失败：%s（%s）", symbol, exc)
+            return None
+
+    # Benchmarks are independent network fetches, so overlap them.
+    with ThreadPoolExecutor(max_workers=min(_MAX_BENCHMARK_WORKERS, len(symbols))) as executor:
+        histories = list(executor.map(fetch, symbols))
+
+    for symbol, history in zip(symbols, histories):
+        if history is None:
             continue
         if history.empty:
-            logger.debug("基准行情为空：%s", target.symbol)
+            logger.debug("基准行情为空：%s", symbol)
             continue
         series = history.get("Close")
         if series is None or series.empty:
-            logger.debug("基准缺少收盘价：%s", target.symbol)
+            logger.debug("基准缺少收盘价：%s", symbol)
             continue
-        benchmark_series[target.symbol] = pd.Series(series.astype(float))
+        benchmark_series[symbol] = _as_float_series(series)
     return benchmark_series
 
 
+def _latest_window_correlation(base: Any, peer: Any, window: int) -> Optional[float]:
+    """Pearson correlation over the trailing ``window`` aligned observations.
+
+    Equals the last value of ``rolling(window).corr`` on the aligned pair.
+    """
+
+    base_tail = base[-window:]
+    peer_tail = peer[-window:]
+    base_dev = base_tail - base_tail.mean()
+    peer_dev = peer_tail - peer_tail.mean()
+    denom = float(np.sqrt(np.dot(base_dev, base_dev) * np.dot(peer_dev, peer_dev)))
+    if not denom > 0.0:
+        return None
+    value = float(np.dot(base_dev, peer_dev)) / denom
+    return value if np.isfinite(value) else None
+
+
 def _compute_cross_asset_correlations(
     base_series: "pd.Series",
     benchmarks: Dict[str, "pd.Series"],
     *,
     targets: Sequence[CorrelationTarget],
 ) -> List[Dict[str, Any]]:
-    """Calculate latest rolling correlation vs configured benchmarks."""
+    """Calculate latest rolling correlation vs configured benchmarks.
 
-    from importlib import import_module
-    import math
+    ``targets`` may repeat a symbol with different windows; each benchmark is
+    aligned with the base series once and reused for every window.
+    """
 
     diagnostics: List[Dict[str, Any]] = []
     if base_series.empty or not targets:
         return diagnostics
 
-    try:  # pragma: no cover - keep pandas optional
-        pd = import_module("pandas")
-    except ModuleNotFoundError:
+    base_series = _as_float_series(base_series)
+    base_values = base_series.to_numpy(dtype=np.float64)
+    base_finite = np.isfinite(base_values)
+    if not base_finite.any():
         return diagnostics
 
-    base_series = pd.Series(base_series.astype(float)).dropna()
-    if base_series.empty:
-        return diagnostics
+    # symbol -> aligned (base, peer) float arrays, or None when unusable.
+    aligned_pairs: Dict[str, Optional[Tuple[Any, Any]]] = {}
+
+    def aligned_pair(symbol: str) -> Optional[Tuple[Any, Any]]:
+        if symbol in aligned_pairs:
+            return aligned_pairs[symbol]
+        pair = None
+        peer = benchmarks.get(symbol)
+        if peer is not None and not peer.empty:
+            # Align on the base dates, then drop every row with a missing or
+            # non-finite value on either side in one mask.
+            peer_values = _as_float_series(peer).reindex(base_series.index).to_numpy(dtype=np.float64)
+            mask = base_finite & np.isfinite(peer_values)
+            base_aligned = base_values[mask]
+            peer_aligned = peer_values[mask]
+            # Skip obviously degenerate cases: zero variance or identical series will produce spurious 1.0 corr.
+            if (
+                base_aligned.size
+                and np.ptp(base_aligned) != 0
+                and np.ptp(peer_aligned) != 0
+                and not np.array_equal(base_aligned, peer_aligned)
+            ):
+                pair = (base_aligned, peer_aligned)
+        aligned_pairs[symbol] = pair
+        return pair
 
     for target in targets:
-        peer = benchmarks.get(target.symbol)
-        if peer is None:
-            continue
-        peer_series = pd.Series(peer.astype(float)).dropna()
-        if peer_series.empty:
-            continue
-
-        aligned = pd.concat([base_series, peer_series], axis=1, join="inner").dropna()
-        if aligned.empty:
-            continue
-
-        # Skip obviously degenerate cases: zero variance or identical series will produce spurious 1.0 corr.
-        if aligned.iloc[:, 0].std() == 0 or aligned.iloc[:, 1].std() == 0:
-            continue
-        if aligned.iloc[:, 0].equals(aligned.iloc[:, 1]):
+        pair = aligned_pair(target.symbol)
+        if pair is None:
             continue
 
         # Require enough overlapping observations to be meaningful.
         window = max(2, target.window)
-        if len(aligned) < window:
+        observations = len(pair[0])
+        if observations < window:
             continue
 
-        corr_series = rolling_correlation(aligned.iloc[:, 0], aligned.iloc[:, 1], window=window)
-        latest = corr_series.dropna()
-        value: Optional[float] = None
-        if not latest.empty:
-            value = float(latest.iloc[-1])
-        else:
-            tail = aligned.tail(window)
-            if len(tail) == window:
-                raw = float(tail.iloc[:, 0].corr(tail.iloc[:, 1]))
-                value = None if math.isnan(raw) else raw
-
+        value = _latest_window_correlation(pair[0], pair[1], window)
         if value is None:
             continue
 
@@ -212,7 +246,7 @@ def _compute_cross_asset_correlations(
                 "label": target.label,
                 "window": window,
                 "value": value,
-                "observations": int(len(aligned)),
+                "observations": int(observations),
             }
         )
 
@@ -224,21 +258,13 @@ def _compute_liquidity_metrics(history: Any, latest_price: Optional[float]) -> D
 
     metrics: Dict[str, Any] = {}
 
-    try:  # pragma: no cover - optional dependency resolution
-        from importlib import import_module
-
-        pd = import_module("pandas")
-        np = import_module("numpy")
-    except ModuleNotFoundError:
-        return metrics
-
     if history is None or getattr(history, "empty", True):
         return metrics
 
     volume_series = None
     if "Volume" in history:
         try:
-            volume_series = pd.Series(history["Volume"].astype(float)).dropna()
+            volume_series = _as_float_series(history["Volume"]).dropna()
         except Exception:  # pragma: no cover - defensive
             volume_series = None
 
@@ -257,9 +283,9 @@ def _compute_liquidity_metrics(history: Any, latest_price: Optional[float]) -> D
     if latest_price and "High" in history and "Low" in history and "Close" in history:
         highs = lows = closes = None
         try:
-            highs = pd.Series(history["High"].astype(float))
-            lows = pd.Series(history["Low"].astype(float))
-            closes = pd.Series(history["Close"].astype(float))
+            highs = _as_float_series(history["High"])
+            lows = _as_float_series(history["Low"])
+            closes = _as_float_series(history["Close"])
             close_nonzero = closes.replace(0, pd.NA)
             spreads_raw = ((highs - lows) / close_nonzero).dropna()
             if not spreads_raw.empty:
@@ -335,16 +361,6 @@ def build_risk_snapshot(
 ) -> Dict[str, Any]:
     """Compute realized and hypothetical risk metrics for the desk."""
 
-    from importlib import import_module
-
-    try:  # pragma: no cover - optional dependency resolution
-        np = import_module("numpy")
-        pd = import_module("pandas")
-    except ModuleNotFoundError as exc:  # pragma: no cover
-        raise ImportError(
-            "The 'numpy' and 'pandas' packages are required for risk computations."
-        ) from exc
-
     close_series = pd.Series(dtype=float)
     latest_price: Optional[float] = None
     portfolio_var_millions: Optional[float] = None
@@ -405,26 +421,24 @@ def build_risk_snapshot(
         drawdown_flag = False
         var_99: Optional[float] = None
         scenario_outcomes: List[Dict[str, Any]] = []
+        scenario_pnls: List[float] = []
         cross_asset_correlations: List[Dict[str, Any]] = []
         liquidity_metrics: Dict[str, Any] = {}
     else:
-        close_series = pd.Series(history["Close"].astype(float))
+        close_series = _as_float_series(history["Close"])
         latest_price = float(close_series.iloc[-1])
-        returns = close_series.pct_change().dropna()
-        vol_annualized = float(np.sqrt(252) * returns.std()) if not returns.empty else None
+        vol_value, var_value = realized_return_stats(close_series.to_numpy(dtype=np.float64), confidence=0.99)
+        vol_annualized = None if isnan(vol_value) else vol_value
         drawdown_threshold = -effective_limits.daily_drawdown_pct / 100 * effective_limits.stress_var_millions
         drawdown_flag = pnl_today_millions <= drawdown_threshold
-        var_value = historical_var(returns, confidence=0.99) if not returns.empty else float("nan")
-        var_99 = None if np.isnan(var_value) else float(var_value)
+        var_99 = None if isnan(var_value) else var_value
 
         projections = apply_scenario(close_series, scenario_shocks)
-        scenario_outcomes = []
-        for label, value in projections:
-            entry: Dict[str, Any] = {"label": label, "projected_price": value}
-            if latest_price is not None:
-                projected_pnl = (value - latest_price) * current_position_oz / 1_000_000
-                entry["projected_pnl_millions"] = float(projected_pnl)
-            scenario_outcomes.append(entry)
+        scenario_pnls = [(value - latest_price) * current_position_oz / 1_000_000 for _, value in projections]
+        scenario_outcomes = [
+            {"label": label, "projected_price": value, "projected_pnl_millions": float(pnl)}
+            for (label, value), pnl in zip(projections, scenario_pnls)
+        ]
 
         if var_99 is not None and latest_price is not None:
             portfolio_var_millions = float(abs(var_99) * latest_price * current_position_oz / 1_000_000)
@@ -434,17 +448,15 @@ def build_risk_snapshot(
             lookback = max(len(close_series) + max_window, max_window * 3, 60)
             benchmark_series = _fetch_benchmark_series(correlation_targets, lookback_days=lookback)
 
-        cross_asset_correlations: List[Dict[str, Any]] = []
-        for window in correlation_windows:
-            diagnostics = _compute_cross_asset_correlations(
-                close_series,
-                benchmark_series,
-                targets=[
-                    CorrelationTarget(symbol=target.symbol, label=target.label, window=max(2, int(window)))
-                    for target in correlation_targets
-                ],
-            )
-            cross_asset_correlations.extend(diagnostics)
+        cross_asset_correlations = _compute_cross_asset_correlations(
+            close_series,
+            benchmark_series,
+            targets=[
+                CorrelationTarget(symbol=target.symbol, label=target.label, window=max(2, int(window)))
+                for window in correlation_windows
+                for target in correlation_targets
+            ],
+        )
 
         liquidity_metrics = _compute_liquidity_metrics(history, latest_price)
 
@@ -456,9 +468,6 @@ def build_risk_snapshot(
         current_position_oz / effective_limits.max_position_oz if effective_limits.max_position_oz else None
     )
 
-    if vol_annualized is not None and isinstance(vol_annualized, float) and isnan(vol_annualized):
-        vol_annualized = None
-
     var_limit_utilization: Optional[float] = None
     if portfolio_var_millions is not None and effective_limits.stress_var_millions:
         var_limit_utilization = portfolio_var_millions / effective_limits.stress_var_millions
@@ -482,11 +491,9 @@ def build_risk_snapshot(
         elif var_limit_utilization >= 0.8:
             risk_alerts.append("var_limit_warning")
 
-    for outcome in scenario_outcomes:
-        projected = outcome.get("projected_pnl_millions")
-        if projected is not None and projected < -effective_limits.stress_var_millions:
-            risk_alerts.append("scenario_loss_exceeds_limit")
-            break
+    scenario_loss_limit = -effective_limits.stress_var_millions
+    if any(pnl < scenario_loss_limit for pnl in scenario_pnls):
+        risk_alerts.append("scenario_loss_exceeds_limit")
 
     snapshot_timestamp = datetime.now(timezone.utc)
     market_session = _infer_market_session(snapshot_timestamp)
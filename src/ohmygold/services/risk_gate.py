@@ -9,11 +9,13 @@ escalate to humans.
 
 from __future__ import annotations
 
+import logging
 import math
 import re
 
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Set
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
 
 from ..config.settings import Settings
 from .audit import record_audit_event
@@ -34,7 +36,7 @@ def _emit_risk_gate_audit(
         tags.append("BREACHED" if report.breached else "PASSED")
         payload: Dict[str, Any] = {
             "breached": report.breached,
-            "evaluated_metrics": report.evaluated_metrics,
+            "evaluated_metrics": dict(report.evaluated_metrics),
         }
         if report.violations:
             payload["violations"] = [violation.to_dict() for violation in report.violations]
@@ -119,7 +121,7 @@ _DATA_QUALITY_CALIBRATIONS: Dict[str, Dict[str, float]] = {
 }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HardRiskViolation:
     """Structured metadata describing a breached hard limit."""
 
@@ -143,18 +145,18 @@ class HardRiskViolation:
         return payload
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HardRiskGateReport:
     """Evaluation outcome for the hard gate layer."""
 
-    violations: List[HardRiskViolation]
-    evaluated_metrics: Dict[str, Any]
+    violations: Sequence[HardRiskViolation]
+    evaluated_metrics: Mapping[str, Any]
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "breached": self.breached,
             "violations": [violation.to_dict() for violation in self.violations],
-            "evaluated_metrics": self.evaluated_metrics,
+            "evaluated_metrics": dict(self.evaluated_metrics),
         }
 
     @property
@@ -180,20 +182,36 @@ class HardRiskBreachError(RuntimeError):
         return f"Hard risk gate breached: {self.report.summary()}"
 
 
-def _as_dict(value: Any) -> Dict[str, Any]:
-    return value if isinstance(value, dict) else {}
+# Shared immutable report returned whenever the hard gate is disabled.
+_DISABLED_REPORT = HardRiskGateReport(violations=(), evaluated_metrics=MappingProxyType({}))
+
+
+# Shared read-only stand-in for missing sections so lookups never allocate.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _as_dict(value: Any) -> Mapping[str, Any]:
+    return value if isinstance(value, dict) else _EMPTY
 
 
 def _safe_float(value: Any) -> Optional[float]:
-    try:
-        if value is None:
+    if value is None:
+        return None
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
+    if isinstance(value, str):
+        if not value.strip():
             return None
-        if isinstance(value, (int, float)):
-            return float(value)
-        if isinstance(value, str) and value.strip():
+        try:
             return float(value)
-    except (TypeError, ValueError):
-        return None
+        except ValueError:
+            return None
+    # Subclasses such as bool or numpy.float64 keep the numeric coercion.
+    if isinstance(value, (int, float)):
+        return float(value)
     return None
 
 
@@ -214,8 +232,7 @@ def _opposite_side(side: Optional[str]) -> Optional[str]:
     return None
 
 
-def _extract_target_position(response: Mapping[str, Any]) -> Optional[float]:
-    details = _as_dict(response.get("details"))
+def _extract_target_position(details: Mapping[str, Any]) -> Optional[float]:
     trading_plan = _as_dict(details.get("trading_plan"))
     base_plan = _as_dict(trading_plan.get("base_plan"))
     target = (
@@ -250,10 +267,9 @@ def _normalize_tag_values(raw: Any) -> List[str]:
     return tags
 
 
-def _extract_strategy_tags(response: Mapping[str, Any], context: Mapping[str, Any]) -> Set[str]:
+def _extract_strategy_tags(details: Mapping[str, Any], context: Mapping[str, Any]) -> Set[str]:
     tags: Set[str] = set()
 
-    details = _as_dict(response.get("details"))
     trading_plan = _as_dict(details.get("trading_plan"))
     base_plan = _as_dict(trading_plan.get("base_plan"))
     alternate_plan = _as_dict(trading_plan.get("alternate_plan"))
@@ -341,28 +357,38 @@ def _format_side_map(values: Mapping[tuple[str, str], float]) -> Dict[str, Dict[
     return formatted
 
 
-def _largest_order_size(orders: Iterable[Mapping[str, Any]]) -> Optional[float]:
-    sizes: List[float] = []
-    for order in orders:
-        size = order.get("size_oz") or order.get("size") or order.get("quantity")
-        numeric = _safe_float(size)
-        if numeric is not None:
-            sizes.append(abs(numeric))
-    return max(sizes) if sizes else None
+_STOP_PROTECTION_TYPES = frozenset({"STOP", "STOP_LIMIT", "STOP_LOSS"})
 
 
-def _has_stop_protection(orders: Iterable[Mapping[str, Any]]) -> bool:
+def _order_has_stop_protection(order: Mapping[str, Any]) -> bool:
+    if str(order.get("type", "")).upper() in _STOP_PROTECTION_TYPES:
+        return True
+    return _safe_float(order.get("stop")) is not None
+
+
+def _scan_orders(orders: Iterable[Mapping[str, Any]]) -> Tuple[Optional[float], int, bool]:
+    """Single pass returning ``(largest size, non-zero order count, stop protected)``.
+
+    Stop protection only considers orders with a non-zero size.
+    """
+
+    largest: Optional[float] = None
+    nonzero_count = 0
+    protected = False
     for order in orders:
-        order_type = str(order.get("type", "")).upper()
-        if order_type in {"STOP", "STOP_LIMIT", "STOP_LOSS"}:
-            return True
-        if _safe_float(order.get("stop")) is not None:
-            return True
-    return False
+        size = _extract_order_size(order)
+        if size is None:
+            continue
+        if largest is None or size > largest:
+            largest = size
+        if size > 0:
+            nonzero_count += 1
+            if not protected and _order_has_stop_protection(order):
+                protected = True
+    return largest, nonzero_count, protected
 
 
-def _collect_orders(response: Mapping[str, Any]) -> List[Dict[str, Any]]:
-    details = _as_dict(response.get("details"))
+def _collect_orders(details: Mapping[str, Any]) -> List[Dict[str, Any]]:
     execution = _as_dict(details.get("execution_checklist"))
     orders = execution.get("orders")
     if isinstance(orders, list):
@@ -377,7 +403,7 @@ def _collect_orders(response: Mapping[str, Any]) -> List[Dict[str, Any]]:
     direct_orders = details.get("orders")
     if isinstance(direct_orders, list):
         return [order for order in direct_orders if isinstance(order, dict)]
-    payload_plan = _as_dict(payload.get("trading_plan")) if payload else {}
+    payload_plan = _as_dict(payload.get("trading_plan"))
     plan = _as_dict(details.get("plan"))
     if payload_plan and not plan:
         plan = payload_plan
@@ -411,8 +437,7 @@ def _collect_orders(response: Mapping[str, Any]) -> List[Dict[str, Any]]:
     return []
 
 
-def _extract_primary_direction(response: Mapping[str, Any]) -> Optional[str]:
-    position = _extract_target_position(response)
+def _primary_direction(position: Optional[float]) -> Optional[str]:
     if position is None or position == 0:
         return None
     return "LONG" if position > 0 else "SHORT"
@@ -737,7 +762,7 @@ def _evaluate_liquidity(
     if relaxation_factor <= 0:
         relaxation_factor = 1.0
 
-    calibration = _as_dict(calibration or {})
+    calibration = _as_dict(calibration)
 
     liquidity_baseline_override = _safe_float(calibration.get("liquidity_baseline_oz"))
     liquidity_baseline = max(1.0, settings.hard_gate_liquidity_baseline_oz)
@@ -877,11 +902,15 @@ def _evaluate_liquidity(
     }
 
 
-def _extract_risk_metrics(response: Mapping[str, Any]) -> Dict[str, Any]:
+def _unpack_response(
+    response: Mapping[str, Any],
+) -> Tuple[Mapping[str, Any], Mapping[str, Any], List[Dict[str, Any]]]:
+    """Walk the response once, returning ``(details, risk_metrics, orders)``."""
+
     details = _as_dict(response.get("details"))
     risk_compliance = _as_dict(details.get("risk_compliance_signoff"))
-    metrics = _as_dict(risk_compliance.get("risk_metrics"))
-    return metrics
+    risk_metrics = _as_dict(risk_compliance.get("risk_metrics"))
+    return details, risk_metrics, _collect_orders(details)
 
 
 def _evaluate_data_quality(settings: Settings, risk_snapshot: Mapping[str, Any]) -> Dict[str, Any]:
@@ -941,15 +970,14 @@ def enforce_hard_limits(
     """Evaluate the final workflow response against hard risk limits."""
 
     if not settings.hard_gate_enabled:
-        report = HardRiskGateReport(violations=[], evaluated_metrics={})
         _emit_risk_gate_audit(
             settings=settings,
-            report=report,
+            report=_DISABLED_REPORT,
             response=response,
             context=context,
             message="Hard risk gate disabled",
         )
-        return report
+        return _DISABLED_REPORT
 
     def _first_non_none(*values: Optional[float]) -> Optional[float]:
         for value in values:
@@ -961,8 +989,7 @@ def enforce_hard_limits(
     evaluated: Dict[str, Any] = {}
 
     risk_snapshot = _as_dict(context.get("risk_snapshot"))
-    risk_metrics = _extract_risk_metrics(response)
-    orders = _collect_orders(response)
+    details, risk_metrics, orders = _unpack_response(response)
     portfolio_state = _as_dict(context.get("portfolio_state"))
 
     data_quality = _evaluate_data_quality(settings, risk_snapshot)
@@ -973,9 +1000,9 @@ def enforce_hard_limits(
         # 暂时不因行情时效触发硬门槛，只记录评估信息供审计/调试
         evaluated["market_data_stale_ignored"] = True
 
-    primary_direction = _extract_primary_direction(response)
-    target_position = _extract_target_position(response)
-    strategy_tags = _extract_strategy_tags(response, context)
+    target_position = _extract_target_position(details)
+    primary_direction = _primary_direction(target_position)
+    strategy_tags = _extract_strategy_tags(details, context)
 
     evaluated["primary_direction"] = primary_direction
     evaluated["target_position_oz"] = target_position
@@ -1024,7 +1051,7 @@ def enforce_hard_limits(
         current_position = 0.0
     evaluated["current_position_oz"] = current_position
 
-    largest_order = _largest_order_size(orders)
+    largest_order, nonzero_order_count, has_stop_protection = _scan_orders(orders)
     evaluated["largest_order_oz"] = largest_order
 
     single_order_limit = settings.hard_gate_max_single_order_oz
@@ -1046,14 +1073,13 @@ def enforce_hard_limits(
             )
         )
 
-    nonzero_orders = [order for order in orders if (_extract_order_size(order) or 0) > 0]
-    evaluated["has_stop_protection"] = _has_stop_protection(nonzero_orders)
-    if settings.hard_gate_require_stop_loss and nonzero_orders and not evaluated["has_stop_protection"]:
+    evaluated["has_stop_protection"] = has_stop_protection
+    if settings.hard_gate_require_stop_loss and nonzero_order_count and not has_stop_protection:
         violations.append(
             HardRiskViolation(
                 code="STOP_LOSS_MISSING",
                 message="No stop-loss protection detected for execution orders",
-                details={"orders_checked": len(nonzero_orders)},
+                details={"orders_checked": nonzero_order_count},
             )
         )
 
@@ -1276,22 +1302,28 @@ def enforce_hard_limits(
     correlation_warnings: List[Dict[str, Any]] = []
     correlation_limits: List[Dict[str, Any]] = []
     correlation_blocks: List[Dict[str, Any]] = []
-    if isinstance(correlations, list):
+    # Configured tiers, most severe first; an entry lands in the first it reaches.
+    correlation_tiers = [
+        (threshold, bucket)
+        for threshold, bucket in (
+            (block_threshold, correlation_blocks),
+            (limit_threshold, correlation_limits),
+            (warning_threshold, correlation_warnings),
+        )
+        if threshold is not None
+    ]
+    if isinstance(correlations, list) and correlation_tiers:
         for entry in correlations:
             if not isinstance(entry, Mapping):
                 continue
             value = _safe_float(entry.get("value"))
             if value is None:
                 continue
-            label = entry.get("label") or entry.get("symbol")
-            record = {"label": label, "value": value}
             abs_value = abs(value)
-            if block_threshold is not None and abs_value >= block_threshold:
-                correlation_blocks.append(record)
-            elif limit_threshold is not None and abs_value >= limit_threshold:
-                correlation_limits.append(record)
-            elif warning_threshold is not None and abs_value >= warning_threshold:
-                correlation_warnings.append(record)
+            for threshold, bucket in correlation_tiers:
+                if abs_value >= threshold:
+                    bucket.append({"label": entry.get("label") or entry.get("symbol"), "value": value})
+                    break
     evaluated["correlation_warnings"] = correlation_warnings
     evaluated["correlation_limits"] = correlation_limits
     evaluated["correlation_blocks"] = correlation_blocks
@@ -1336,9 +1368,11 @@ def enforce_hard_limits(
             )
         )
 
-    if violations:
-        for violation in violations:
-            logger.error("硬风控约束触发：%s -> %s", violation.code, violation.message)
+    if violations and logger.isEnabledFor(logging.ERROR):
+        logger.error(
+            "硬风控约束触发：%s",
+            "; ".join(f"{violation.code} -> {violation.message}" for violation in violations),
+        )
 
     report = HardRiskGateReport(violations=violations, evaluated_metrics=evaluated)
     _emit_risk_gate_audit(
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from typing import Iterable, List, Tuple
 
 import numpy as np
 import pandas as pd
 
+try:  # pragma: no cover - optional JIT for the return statistics kernel
+    from numba import njit
+except ImportError:  # pragma: no cover
+    njit = None
+
+# Annualisation factor for daily return volatility.
+_SQRT_252 = math.sqrt(252.0)
+
 
 @dataclass
 class ScenarioShock:
@@ -35,7 +44,90 @@ def historical_var(returns: pd.Series, confidence: float = 0.99) -> float:
         return float("nan")
     if not 0.0 < confidence < 1.0:
         raise ValueError("confidence must be between 0 and 1")
-    return float(np.nanpercentile(returns.dropna(), (1 - confidence) * 100))
+    values = returns.to_numpy(dtype=np.float64)
+    values = values[~np.isnan(values)]
+    if values.size == 0:
+        return float("nan")
+    return float(_partition_quantile(values, confidence))
+
+
+def _partition_quantile_loop(values, confidence):  # pragma: no cover - compiled by numba
+    """Linear-interpolated lower-tail quantile, matching ``np.percentile``.
+
+    Selects the two bracketing order statistics with a partition instead of
+    sorting the whole array. ``values`` must be non-empty and NaN-free.
+    """
+
+    position = (1.0 - confidence) * (values.shape[0] - 1)
+    lower = int(position)
+    selected = np.partition(values, lower)
+    low_value = selected[lower]
+    if lower + 1 >= values.shape[0]:
+        return low_value
+    high_value = selected[lower + 1 :].min()
+    return low_value + (high_value - low_value) * (position - lower)
+
+
+_partition_quantile = (
+    njit(cache=True)(_partition_quantile_loop) if njit is not None else _partition_quantile_loop
+)
+
+
+def _return_stats_loop(closes, confidence):  # pragma: no cover - compiled by numba
+    """Annualised volatility and historical VaR of simple returns in one pass.
+
+    Mirrors ``pct_change().dropna()`` followed by ``std()`` (ddof=1) and the
+    partition-based quantile shared with :func:`historical_var`.
+    """
+
+    n = closes.shape[0]
+    returns = np.empty(max(n - 1, 0), dtype=np.float64)
+    count = 0
+    for i in range(1, n):
+        value = closes[i] / closes[i - 1] - 1.0
+        if not np.isnan(value):
+            returns[count] = value
+            count += 1
+    if count == 0:
+        return np.nan, np.nan
+    returns = returns[:count]
+    vol = np.nan
+    if count > 1:
+        vol = _SQRT_252 * np.std(returns) * np.sqrt(count / (count - 1.0))
+    return vol, _partition_quantile(returns, confidence)
+
+
+# error_model="numpy" makes a zero close yield inf/nan returns like the NumPy
+# fallback instead of raising ZeroDivisionError.
+_return_stats_kernel = (
+    njit(cache=True, error_model="numpy")(_return_stats_loop) if njit is not None else None
+)
+
+
+def realized_return_stats(closes: np.ndarray, confidence: float = 0.99) -> Tuple[float, float]:
+    """Return ``(annualised volatility, historical VaR)`` for a close-price array.
+
+    Equivalent to ``sqrt(252) * closes.pct_change().dropna().std()`` and
+    :func:`historical_var` on the same returns, without building Series.
+    Either value is NaN when there are too few returns.
+    """
+
+    if not 0.0 < confidence < 1.0:
+        raise ValueError("confidence must be between 0 and 1")
+    values = np.ascontiguousarray(closes, dtype=np.float64)
+    if _return_stats_kernel is not None:
+        vol, var = _return_stats_kernel(values, confidence)
+        return float(vol), float(var)
+
+    if len(values) < 2:
+        return float("nan"), float("nan")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = values[1:] / values[:-1] - 1.0
+    returns = returns[~np.isnan(returns)]
+    if returns.size == 0:
+        return float("nan"), float("nan")
+    vol = float(_SQRT_252 * returns.std(ddof=1)) if returns.size > 1 else float("nan")
+    return vol, float(_partition_quantile(returns, confidence))
 
 
 def apply_scenario(base_levels: pd.Series, shocks: Iterable[ScenarioShock]) -> List[Tuple[str, float]]:
@@ -44,8 +136,7 @@ def apply_scenario(base_levels: pd.Series, shocks: Iterable[ScenarioShock]) -> L
     if base_levels.empty:
         return []
     latest = float(base_levels.iloc[-1])
-    projections: List[Tuple[str, float]] = []
-    for shock in shocks:
-        projected = latest * (1 + shock.pct_change)
-        projections.append((shock.label, projected))
-    return projections
+    shocks = list(shocks)
+    pcts = np.fromiter((shock.pct_change for shock in shocks), dtype=np.float64, count=len(shocks))
+    projected = latest * (1.0 + pcts)
+    return list(zip((shock.label for shock in shocks), projected.tolist()))
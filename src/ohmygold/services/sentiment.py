@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import re
@@ -241,6 +242,12 @@ def collect_sentiment_snapshot(
     }
 
 
+async def collect_sentiment_snapshot_async(symbol: str = "XAUUSD", **kwargs: Any) -> Dict[str, Any]:
+    """Run :func:`collect_sentiment_snapshot` in a worker thread for use with asyncio."""
+
+    return await asyncio.to_thread(collect_sentiment_snapshot, symbol, **kwargs)
+
+
 def export_sentiment_json(
     symbol: str = "XAUUSD",
     *,
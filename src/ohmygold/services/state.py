@@ -3,9 +3,18 @@
 from __future__ import annotations
 
 import json
-from pathlib import Path
+import os
+import tempfile
+from contextlib import contextmanager
 from copy import deepcopy
-from typing import Any, Dict, Mapping
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, Mapping
+
+try:  # pragma: no cover - POSIX only
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
 
 from ..utils.logging import get_logger
 
@@ -14,36 +23,53 @@ logger = get_logger(__name__)
 _STATE_FILENAME = "portfolio_state.json"
 
 
+@lru_cache(maxsize=1)
 def _state_file_path() -> Path:
     return Path(__file__).resolve().parent.parent / "outputs" / _STATE_FILENAME
 
 
+_DEFAULT_STATE: Dict[str, Any] = {
+    "positions": {
+        "symbol": "XAUUSD",
+        "net_oz": 0.0,
+        "average_cost": None,
+    },
+    "pnl": {
+        "realized_millions": 0.0,
+        "unrealized_millions": 0.0,
+    },
+    "risk_controls": {
+        "consecutive_losses": 0,
+        "baseline_vol_annualized": None,
+        "last_triggered_at": None,
+        "last_evaluated_at": None,
+        "cooldown_until": None,
+    },
+    "last_updated": None,
+}
+
+
 def _default_state() -> Dict[str, Any]:
-    return {
-        "positions": {
-            "symbol": "XAUUSD",
-            "net_oz": 0.0,
-            "average_cost": None,
-        },
-        "pnl": {
-            "realized_millions": 0.0,
-            "unrealized_millions": 0.0,
-        },
-        "risk_controls": {
-            "consecutive_losses": 0,
-            "baseline_vol_annualized": None,
-            "last_triggered_at": None,
-            "last_evaluated_at": None,
-            "cooldown_until": None,
-        },
-        "last_updated": None,
-    }
+    return deepcopy(_DEFAULT_STATE)
 
 
-def load_portfolio_state() -> Dict[str, Any]:
-    """Load portfolio state from disk or return defaults."""
+@contextmanager
+def _state_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on ``path`` for concurrent agent writers."""
 
-    path = _state_file_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if fcntl is None:  # pragma: no cover - non-POSIX platforms
+        yield
+        return
+    with open(path.with_name(path.name + ".lock"), "a") as lock_handle:
+        fcntl.flock(lock_handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_handle, fcntl.LOCK_UN)
+
+
+def _read_state(path: Path) -> Dict[str, Any]:
     if not path.exists():
         logger.info("未找到状态文件：%s，使用默认参数", path)
         return _default_state()
@@ -65,13 +91,32 @@ def load_portfolio_state() -> Dict[str, Any]:
     return state
 
 
+def _write_state(path: Path, state: Mapping[str, Any]) -> None:
+    # Swap in a fully written sibling file so a crash never leaves a
+    # truncated state file behind.
+    payload = json.dumps(state, separators=(",", ":")).encode("utf-8")
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".portfolio_state.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def load_portfolio_state() -> Dict[str, Any]:
+    """Load portfolio state from disk or return defaults."""
+
+    return _read_state(_state_file_path())
+
+
 def save_portfolio_state(state: Dict[str, Any]) -> Path:
     """Persist the portfolio state to disk."""
 
     path = _state_file_path()
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(state, handle, indent=2)
+    with _state_lock(path):
+        _write_state(path, state)
     logger.info("组合状态已保存：%s", path)
     return path
 
@@ -79,9 +124,12 @@ def save_portfolio_state(state: Dict[str, Any]) -> Path:
 def update_portfolio_state(update: Dict[str, Any]) -> Dict[str, Any]:
     """Merge partial updates into the stored portfolio state and persist."""
 
-    state = load_portfolio_state()
-    state.update(update)
-    save_portfolio_state(state)
+    path = _state_file_path()
+    with _state_lock(path):
+        state = _read_state(path)
+        state.update(update)
+        _write_state(path, state)
+    logger.info("组合状态已保存：%s", path)
     return state
 
 
@@ -100,9 +148,12 @@ def apply_portfolio_state_patch(patch: Mapping[str, Any]) -> Dict[str, Any]:
         logger.debug("空的组合状态补丁，直接返回当前状态")
         return load_portfolio_state()
 
-    state = load_portfolio_state()
-    merged = deepcopy(state)
-    _deep_merge(merged, patch)
+    path = _state_file_path()
     logger.info("应用组合状态补丁：%s", json.dumps(patch, ensure_ascii=False))
-    save_portfolio_state(merged)
-    return merged
\ No newline at end of file
+    with _state_lock(path):
+        # The freshly read state is private to this call, so merge in place.
+        merged = _read_state(path)
+        _deep_merge(merged, patch)
+        _write_state(path, merged)
+    logger.info("组合状态已保存：%s", path)
+    return merged
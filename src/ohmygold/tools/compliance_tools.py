@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Dict, Mapping, Optional
 
 from ..config.settings import Settings, get_settings
@@ -9,6 +10,17 @@ from ..services.compliance import evaluate_compliance
 from ..services.risk import RiskLimits
 
 
+@lru_cache(maxsize=4)
+def _limits_for(max_position_oz: float, stress_var_millions: float, daily_drawdown_pct: float) -> RiskLimits:
+    """Shared ``RiskLimits`` per configured limit values; callers must not mutate it."""
+
+    return RiskLimits(
+        max_position_oz=max_position_oz,
+        stress_var_millions=stress_var_millions,
+        daily_drawdown_pct=daily_drawdown_pct,
+    )
+
+
 def run_compliance_checks(
     plan: Mapping[str, Any],
     *,
@@ -19,11 +31,13 @@ def run_compliance_checks(
     """Execute structural compliance checks over a proposed trade plan."""
 
     effective_settings = settings or get_settings()
-    effective_limits = limits or RiskLimits(
-        max_position_oz=effective_settings.max_position_oz,
-        stress_var_millions=effective_settings.stress_var_millions,
-        daily_drawdown_pct=effective_settings.daily_drawdown_pct,
-    )
+    effective_limits = limits
+    if effective_limits is None:
+        effective_limits = _limits_for(
+            effective_settings.max_position_oz,
+            effective_settings.stress_var_millions,
+            effective_settings.daily_drawdown_pct,
+        )
 
     position = current_position_oz if current_position_oz is not None else effective_settings.default_position_oz
     return evaluate_compliance(
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 try:  # pragma: no cover
     import pandas as pd
@@ -20,21 +21,25 @@ from ..utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+def _float_list(series: pd.Series) -> List[Optional[float]]:
+    """Convert ``series`` to Python floats with NaN mapped to ``None``."""
+
+    # NaN is the only value that compares unequal to itself.
+    return [None if value != value else value for value in series.to_numpy(dtype=float).tolist()]
+
+
 def get_gold_market_snapshot(symbol: str = "XAUUSD", days: int = 30) -> Dict[str, Any]:
     """Return a comprehensive snapshot for gold including price and indicator metrics."""
 
-    snapshot = market_snapshot(symbol, days=days)
     history = fetch_price_history(symbol, days=days)
     indicators = compute_indicators(history)
+    snapshot = market_snapshot(symbol, days=days, history=history, indicators=indicators)
 
     return {
         "generated_at": datetime.now(timezone.utc).isoformat(),
         "symbol": symbol,
         "market": snapshot,
-        "indicators": {
-            name: [float(value) if not pd.isna(value) else None for value in series.tail(10)]
-            for name, series in indicators.items()
-        },
+        "indicators": {name: _float_list(series.tail(10)) for name, series in indicators.items()},
     }
 
 
@@ -44,10 +49,14 @@ def _fetch_series_with_fallback(
 ) -> Optional[Tuple[str, str, pd.Series, pd.Series]]:
     """Return aligned close series for the first successful symbol pair."""
 
+    def _fetch(symbol: str) -> pd.DataFrame:
+        return fetch_price_history(symbol, days=days)
+
     for gold_symbol, silver_symbol in candidates:
         try:
-            gold_history = fetch_price_history(gold_symbol, days=days)
-            silver_history = fetch_price_history(silver_symbol, days=days)
+            # Both legs are independent network lookups; fetch them concurrently.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                gold_history, silver_history = executor.map(_fetch, (gold_symbol, silver_symbol))
         except Exception as exc:  # pragma: no cover - defensive guard for provider errors
             logger.warning(
                 "获取金银比行情失败：%s/%s -> %s", gold_symbol, silver_symbol, exc
@@ -96,16 +105,14 @@ def get_gold_silver_ratio(days: int = 60) -> Dict[str, Any]:
     gold_symbol, silver_symbol, gold_series, silver_series = result
     ratio_series = gold_series / silver_series
     ratio_series = ratio_series.dropna()
+    ratio_tail = ratio_series.tail(30)
 
     return {
         "generated_at": datetime.now(timezone.utc).isoformat(),
         "pair": {"gold": gold_symbol, "silver": silver_symbol},
         "series": [
-            {
-                "date": index.strftime("%Y-%m-%d"),
-                "ratio": float(value) if not pd.isna(value) else None,
-            }
-            for index, value in ratio_series.tail(30).items()
+            {"date": date, "ratio": value}
+            for date, value in zip(ratio_tail.index.strftime("%Y-%m-%d").tolist(), _float_list(ratio_tail))
         ],
         "latest": float(ratio_series.iloc[-1]) if not ratio_series.empty else None,
     }
@@ -125,8 +132,12 @@ def get_macro_snapshot() -> Dict[str, Any]:
                 return symbol, history
         return None, pd.DataFrame()
 
-    dxy_symbol, dxy_history = _first_available(("DX-Y.NYB", "DXY", "DX-Y"), days=45)
-    tip_symbol, tip_history = _first_available(("TIP", "IEF"), days=45)
+    # The two candidate chains are independent network lookups; run them side by side.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        dxy_future = executor.submit(_first_available, ("DX-Y.NYB", "DXY", "DX-Y"), 45)
+        tip_future = executor.submit(_first_available, ("TIP", "IEF"), 45)
+        dxy_symbol, dxy_history = dxy_future.result()
+        tip_symbol, tip_history = tip_future.result()
 
     result: Dict[str, Any] = {
         "generated_at": datetime.now(timezone.utc).isoformat(),
@@ -5,7 +5,8 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any, Dict
 
-from ..services.state import load_portfolio_state, save_portfolio_state
+from ..services.state import load_portfolio_state
+from ..services.state import update_portfolio_state as _update_portfolio_state
 
 
 def get_portfolio_state() -> Dict[str, Any]:
@@ -17,8 +18,5 @@ def get_portfolio_state() -> Dict[str, Any]:
 def update_portfolio_state(update: Dict[str, Any]) -> Dict[str, Any]:
     """Merge the provided update into the existing portfolio state and save it."""
 
-    state = load_portfolio_state()
-    state.update(update)
-    state["last_updated"] = datetime.now(timezone.utc).isoformat()
-    save_portfolio_state(state)
-    return state
+    stamped = {**update, "last_updated": datetime.now(timezone.utc).isoformat()}
+    return _update_portfolio_state(stamped)
@@ -370,14 +370,23 @@ class _JsonVectorStore(_VectorStore):
         self._path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
 
     def add_chunks(self, chunks: Sequence[_StoredChunk]) -> int:
-        inserted = 0
+        pending: List[_StoredChunk] = []
+        pending_fingerprints: set[str] = set()
         for chunk in chunks:
-            if chunk.fingerprint in self._fingerprints:
+            if chunk.fingerprint in self._fingerprints or chunk.fingerprint in pending_fingerprints:
                 continue
+            pending_fingerprints.add(chunk.fingerprint)
+            pending.append(chunk)
+        if not pending:
+            return 0
+
+        # Embed the whole batch in one call rather than one call per chunk.
+        vectors = self._embedding_function([chunk.text for chunk in pending])
+        inserted = 0
+        for chunk, vector in zip(pending, vectors):
             metadata = dict(chunk.metadata)
             metadata.setdefault("source", metadata.get("source", "unknown"))
             metadata.setdefault("fingerprint", chunk.fingerprint)
-            vector = self._embedding_function.embed_text(chunk.text)
             json_chunk = _JsonChunk(
                 chunk_id=chunk.chunk_id,
                 text=chunk.text,
@@ -11,6 +11,34 @@ try:  # pragma: no cover - optional dependency resolution
 except ModuleNotFoundError as exc:  # pragma: no cover
     raise ImportError("The 'pandas' package is required for serialization helpers.") from exc
 
+import numpy as np
+
+
+def _convert(value: Any) -> Any:
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if isinstance(value, (int, float)):
+        numeric = float(value)
+        return None if isnan(numeric) else numeric
+    return value
+
+
+def _column_values(column: Any) -> List[Any]:
+    """Convert one column to JSON-friendly values, vectorised for common dtypes."""
+
+    dtype = column.dtype
+    if dtype.kind in "biuf":
+        values = column.to_numpy(dtype=np.float64)
+        converted = values.astype(object)
+        converted[np.isnan(values)] = None
+        return converted.tolist()
+    if dtype.kind == "M":
+        values = column.to_numpy()
+        # Whole-second naive timestamps format exactly like Timestamp.isoformat().
+        if not (values.astype("datetime64[s]") != values).any():
+            return np.datetime_as_string(values, unit="s").tolist()
+    return [_convert(value) for value in column.tolist()]
+
 
 def df_to_records(frame: Any, *, include_index: bool = True) -> List[Dict[str, Any]]:
     """Convert a DataFrame to a list of JSON-serializable dict records."""
@@ -19,23 +47,11 @@ def df_to_records(frame: Any, *, include_index: bool = True) -> List[Dict[str, A
         return []
 
     if include_index:
-        frame = frame.copy()
-        frame.reset_index(inplace=True)
-
-    records = frame.to_dict(orient="records")
-
-    def _convert(value: Any) -> Any:
-        if hasattr(value, "isoformat"):
-            return value.isoformat()
-        if isinstance(value, (int, float)):
-            numeric = float(value)
-            return None if isnan(numeric) else numeric
-        return value
-
-    return [
-        {key: _convert(value) for key, value in record.items()}
-        for record in records
-    ]
+        frame = frame.reset_index()
+
+    keys = list(frame.columns)
+    columns = [_column_values(frame.iloc[:, position]) for position in range(len(keys))]
+    return [dict(zip(keys, row)) for row in zip(*columns)]
 
 
 def to_key_value_pairs(items: Iterable[str], *, category: str) -> List[Dict[str, str]]:
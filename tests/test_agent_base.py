@@ -5,7 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 from types import SimpleNamespace
 
-from ohmygold.agents.base import _build_code_execution_config
+from ohmygold.agents.base import _build_code_execution_config, build_llm_config
 from ohmygold.config.settings import Settings
 
 
@@ -65,3 +65,23 @@ def test_build_code_execution_config_uses_default_dir(monkeypatch, tmp_path: Pat
     assert config is not None
     assert created_paths and created_paths[0].exists()
     assert hasattr(config["executor"], "timeout")
+
+
+def test_build_llm_config_returns_independent_copies(tmp_path: Path) -> None:
+    settings = _make_settings(
+        tmp_path,
+        local_model_enabled=True,
+        local_model_agents=["QuantResearchAgent"],
+    )
+
+    local = build_llm_config(settings, agent_name="QuantResearchAgent")
+    remote = build_llm_config(settings, agent_name="TechAnalystAgent")
+    assert [entry["model"] for entry in local["config_list"]] == [
+        settings.local_model_name,
+        settings.deepseek_model,
+    ]
+    assert [entry["model"] for entry in remote["config_list"]] == [settings.deepseek_model]
+
+    local["config_list"].clear()
+    again = build_llm_config(settings, agent_name="QuantResearchAgent")
+    assert len(again["config_list"]) == 2
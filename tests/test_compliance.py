@@ -78,3 +78,60 @@ def test_run_compliance_checks_wrapper_uses_settings() -> None:
     assert result["violations"] == []
     assert result["orders_checked"] == 1
     assert result["projected_position_oz"] == -25.0
+
+
+def test_evaluate_compliance_plan_reports_match_single_order_runs() -> None:
+    settings = Settings(  # type: ignore[call-arg]
+        deepseek_api_key="test-key",
+        compliance_allowed_counterparties=["CME"],
+        compliance_restricted_instruments=["BTC"],
+        compliance_require_take_profit=True,
+    )
+    base_orders = [
+        {"instrument": "XAUUSD", "side": "buy", "size_oz": 100, "stop": 2300, "target": 2400, "counterparty": "CME"},
+        {"instrument": " gc ", "side": " SELL ", "size_oz": "250", "stop": 2300, "counterparty": "LME"},
+        {"instrument": "BTC", "side": "hold", "size_oz": "abc", "target": 2400},
+        {"instrument": None, "side": None, "size_oz": -5, "counterparty": None},
+        {"instrument": "GLD", "side": "sell", "size_oz": 1e9, "stop": 175, "target": 160},
+    ]
+    plan = {"orders": base_orders * 2}
+
+    result = evaluate_compliance(plan, current_position_oz=10.0, settings=settings)
+    expected = [
+        evaluate_compliance({"orders": [order]}, settings=settings)["order_reports"][0]
+        for order in plan["orders"]
+    ]
+
+    assert result["orders_checked"] == 10
+    for index, (actual, reference) in enumerate(zip(result["order_reports"], expected)):
+        assert actual == {**reference, "index": index}
+    assert result["net_exposure_oz"] == 2 * (100.0 - 250.0 - 1e9)
+
+
+def test_evaluate_compliance_parses_string_sizes() -> None:
+    settings = Settings(deepseek_api_key="test-key")  # type: ignore[call-arg]
+    base_orders = [
+        {"instrument": "XAUUSD", "side": "buy", "size_oz": "1_000", "stop": 2300, "counterparty": "CME"},
+        {"instrument": "XAUUSD", "side": "sell", "size_oz": "١٢", "stop": 2300, "counterparty": "CME"},
+        {"instrument": "XAUUSD", "side": "buy", "size_oz": " 7.5 ", "stop": 2300, "counterparty": "CME"},
+        {"instrument": "XAUUSD", "side": "buy", "size_oz": "", "stop": 2300, "counterparty": "CME"},
+    ]
+    plan = {"orders": base_orders * 2}
+
+    result = evaluate_compliance(plan, current_position_oz=0.0, settings=settings)
+    scalar = evaluate_compliance({"orders": base_orders[:2]}, current_position_oz=0.0, settings=settings)
+
+    assert [report["size_oz"] for report in result["order_reports"]] == [1000.0, 12.0, 7.5, None] * 2
+    assert result["order_reports"][:2] == scalar["order_reports"]
+    assert result["net_exposure_oz"] == 2 * (1000.0 - 12.0 + 7.5)
+
+
+def test_evaluate_compliance_flags_nan_size_as_invalid() -> None:
+    settings = Settings(deepseek_api_key="test-key")  # type: ignore[call-arg]
+    order = {"instrument": "XAUUSD", "side": "buy", "size_oz": float("nan"), "stop": 2300, "counterparty": "CME"}
+
+    for count in (1, 8):
+        result = evaluate_compliance({"orders": [order] * count}, current_position_oz=0.0, settings=settings)
+        assert all(report["size_oz"] is None for report in result["order_reports"])
+        assert all("invalid_size_oz" in report["violations"] for report in result["order_reports"])
+        assert result["net_exposure_oz"] == 0.0
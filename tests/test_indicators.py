@@ -0,0 +1,55 @@
+"""Tests for technical indicator calculations."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from ohmygold.services.indicators import compute_indicators
+
+ALL_KEYS = [
+    "sma_20",
+    "sma_50",
+    "rsi_14",
+    "atr_14",
+    "macd",
+    "macd_signal",
+    "macd_diff",
+    "bb_high",
+    "bb_low",
+    "bb_mavg",
+]
+
+
+def _history(bars: int) -> pd.DataFrame:
+    close = 1900.0 + np.cumsum(np.random.default_rng(3).normal(0.0, 4.0, size=bars))
+    index = pd.date_range("2024-01-01", periods=bars, freq="D", name="Date")
+    return pd.DataFrame({"Close": close, "High": close + 2.0, "Low": close - 2.0}, index=index)
+
+
+def test_compute_indicators_keeps_short_window_keys_as_nan() -> None:
+    indicators = compute_indicators(_history(30))
+
+    assert list(indicators) == ALL_KEYS
+    assert indicators["sma_50"].isna().all()
+    assert len(indicators["sma_50"]) == 30
+    for key in ("sma_20", "rsi_14", "atr_14", "macd", "bb_mavg"):
+        assert indicators[key].notna().all(), key
+
+
+def test_compute_indicators_all_nan_below_every_window() -> None:
+    indicators = compute_indicators(_history(10))
+
+    assert list(indicators) == ALL_KEYS
+    assert all(series.isna().all() for series in indicators.values())
+
+
+def test_compute_indicators_only_matches_full_run() -> None:
+    history = _history(60)
+    full = compute_indicators(history)
+
+    subset = compute_indicators(history, only=iter(["atr_14", "macd_diff", "unknown"]))
+
+    assert list(subset) == ["atr_14", "macd_diff"]
+    for key, series in subset.items():
+        pd.testing.assert_series_equal(series, full[key])
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+
+import pandas as pd
 import pytest
 
+from ohmygold.services import market_data
 from ohmygold.services.market_data import fetch_price_history
 
 
@@ -11,3 +15,53 @@ from ohmygold.services.market_data import fetch_price_history
 def test_fetch_price_history_smoke() -> None:
     history = fetch_price_history("XAUUSD", days=1)
     assert history is not None
+
+
+def test_fetch_price_histories_maps_each_symbol(monkeypatch) -> None:
+    calls = []
+
+    def fake_fetch(symbol: str, days: int = 14) -> pd.DataFrame:
+        calls.append((symbol, days))
+        return pd.DataFrame({"Close": [float(len(symbol))]})
+
+    monkeypatch.setattr(market_data, "fetch_price_history", fake_fetch)
+
+    result = market_data.fetch_price_histories(["XAUUSD", "DXY", "XAUUSD", "TIP"], days=30)
+
+    assert list(result) == ["XAUUSD", "DXY", "TIP"]
+    assert result["DXY"]["Close"].iloc[0] == 3.0
+    assert sorted(calls) == [("DXY", 30), ("TIP", 30), ("XAUUSD", 30)]
+
+
+def test_latest_quote_prefers_adapter_fast_path(monkeypatch) -> None:
+    class FakeAdapter:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def fetch_latest(self, symbol: str, *, session=None) -> float:
+            self.calls += 1
+            return 2345.5
+
+    adapter = FakeAdapter()
+    monkeypatch.setattr(market_data, "_build_provider_chain", lambda settings: [("fake", adapter, "Fake")])
+    monkeypatch.setattr(market_data, "_cached_session", lambda settings: None)
+    monkeypatch.setattr(market_data, "_QUOTE_CACHE", {})
+    monkeypatch.setattr(market_data, "get_settings", lambda: SimpleNamespace(data_mode="live", data_provider="fake"))
+
+    def unexpected_history(*args, **kwargs):  # pragma: no cover - must not be reached
+        raise AssertionError("history path should be skipped")
+
+    monkeypatch.setattr(market_data, "fetch_price_history", unexpected_history)
+
+    assert market_data.latest_quote("XAUUSD") == 2345.5
+    assert market_data.latest_quote("XAUUSD") == 2345.5
+    assert adapter.calls == 1
+
+
+def test_mock_price_history_is_reproducible_per_symbol() -> None:
+    first = market_data._mock_price_history("XAUUSD", 10)
+    second = market_data._mock_price_history("XAUUSD", 10)
+    other = market_data._mock_price_history("XAGUSD", 10)
+
+    pd.testing.assert_frame_equal(first, second)
+    assert not first["Close"].equals(other["Close"])
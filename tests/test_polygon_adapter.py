@@ -0,0 +1,93 @@
+"""Tests for the Polygon.io adapter pagination and column decoding."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ohmygold.services.data_providers import polygon_adapter
+from ohmygold.services.data_providers.polygon_adapter import PolygonAdapter
+
+DAY_MS = 86_400_000
+START_MS = 1_704_067_200_000  # 2024-01-01T00:00:00Z
+
+
+def _bar(day: int) -> dict:
+    close = 2000.0 + day
+    return {"t": START_MS + day * DAY_MS, "o": close - 1, "h": close + 2, "l": close - 2, "c": close, "v": 1000 + day}
+
+
+class FakeResponse:
+    def __init__(self, payload: dict) -> None:
+        self.content = json.dumps(payload).encode("utf-8")
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def json(self) -> dict:
+        return json.loads(self.content)
+
+
+class FakeSession:
+    def __init__(self, pages: list) -> None:
+        self.pages = pages
+        self.calls: list = []
+
+    def get(self, url: str, params=None, timeout=None) -> FakeResponse:
+        self.calls.append((url, params))
+        return FakeResponse(self.pages[min(len(self.calls), len(self.pages)) - 1])
+
+
+def _fetch(session: FakeSession) -> pd.DataFrame:
+    adapter = PolygonAdapter("key")
+    return adapter.fetch_price_history(
+        "C:XAUUSD",
+        start=datetime(2024, 1, 1),
+        end=datetime(2024, 1, 31),
+        session=session,
+    )
+
+
+def test_fetch_price_history_follows_next_url_without_pyarrow(monkeypatch) -> None:
+    monkeypatch.setattr(polygon_adapter, "pa", None)
+    session = FakeSession(
+        [
+            {"status": "OK", "results": [_bar(0), _bar(1)], "next_url": "https://api.polygon.io/next?cursor=a"},
+            {"status": "OK", "results": [_bar(2)]},
+        ]
+    )
+
+    frame = _fetch(session)
+
+    assert len(session.calls) == 2
+    assert session.calls[1] == ("https://api.polygon.io/next?cursor=a", {"apiKey": "key"})
+    assert list(frame.columns) == ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
+    assert frame["Close"].tolist() == [2000.0, 2001.0, 2002.0]
+    assert frame.index[-1] == pd.Timestamp("2024-01-03")
+
+
+def test_fetch_price_history_stops_at_page_cap(monkeypatch) -> None:
+    monkeypatch.setattr(polygon_adapter, "pa", None)
+    monkeypatch.setattr(polygon_adapter, "_MAX_PAGES", 3)
+    session = FakeSession([{"status": "OK", "results": [_bar(0)], "next_url": "https://api.polygon.io/loop"}])
+
+    frame = _fetch(session)
+
+    assert len(session.calls) == 3
+    assert len(frame) == 3
+
+
+def test_arrow_columns_match_row_fallback() -> None:
+    pytest.importorskip("pyarrow")
+    rows = [_bar(0), {"t": START_MS + DAY_MS, "c": 2001.5}, _bar(2)]
+
+    arrow_stamps, arrow_values = polygon_adapter._columns_from_arrow(rows)
+    row_stamps, row_values = polygon_adapter._columns_from_rows(rows)
+
+    np.testing.assert_array_equal(arrow_stamps, row_stamps)
+    for key, values in row_values.items():
+        np.testing.assert_array_equal(arrow_values[key], values)
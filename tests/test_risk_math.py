@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from ohmygold.services.risk_math import (
     ScenarioShock,
+    _return_stats_loop,
     apply_scenario,
     historical_var,
+    realized_return_stats,
     rolling_correlation,
 )
 
@@ -50,3 +53,36 @@ def test_apply_scenario_projects_levels() -> None:
     ]
 
 
+def test_realized_return_stats_matches_series_path() -> None:
+    closes = pd.Series([1900.0, 1912.5, float("nan"), 1905.0, 1921.0, 1898.5, 1930.25])
+    returns = closes.pct_change().dropna()
+
+    vol, var = realized_return_stats(closes.to_numpy(), confidence=0.95)
+
+    assert vol == pytest.approx(float(np.sqrt(252) * returns.std()))
+    assert var == pytest.approx(historical_var(returns, confidence=0.95))
+
+
+def test_realized_return_stats_var_matches_percentile() -> None:
+    closes = 1900.0 + np.cumsum(np.random.default_rng(0).normal(0.0, 5.0, size=300))
+    returns = closes[1:] / closes[:-1] - 1.0
+
+    for confidence in (0.9, 0.95, 0.99):
+        _, var = realized_return_stats(closes, confidence=confidence)
+        assert var == pytest.approx(np.percentile(returns, (1 - confidence) * 100))
+
+
+def test_realized_return_stats_short_history_is_nan() -> None:
+    vol, var = realized_return_stats(np.array([1900.0]))
+    assert np.isnan(vol) and np.isnan(var)
+
+
+def test_realized_return_stats_zero_close_matches_kernel_body() -> None:
+    closes = np.array([1900.0, 0.0, 1910.0, 1920.0, 1915.0])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        kernel_vol, kernel_var = _return_stats_loop(closes, 0.99)
+    vol, var = realized_return_stats(closes)
+
+    assert np.isnan(vol) and np.isnan(kernel_vol)
+    assert var == pytest.approx(kernel_var)
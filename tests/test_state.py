@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
+import pytest
+
 from ohmygold.services import state
+from ohmygold.tools import portfolio
 
 
 def _mock_state_path(tmp_path: Path) -> Path:
@@ -50,3 +54,34 @@ def test_apply_state_patch_preserves_nested_defaults(tmp_path, monkeypatch) -> N
 
     persisted = state.load_portfolio_state()
     assert persisted["risk_controls"]["consecutive_losses"] == 3
+
+
+def test_tool_update_merges_and_replaces_atomically(tmp_path, monkeypatch) -> None:
+    path = _mock_state_path(tmp_path)
+    monkeypatch.setattr(state, "_state_file_path", lambda: path)
+    state.update_portfolio_state({"cash": 1_000_000.0, "positions": {"symbol": "XAUUSD", "net_oz": 50.0}})
+
+    updated = portfolio.update_portfolio_state({"positions": {"symbol": "XAUUSD", "net_oz": 75.0}})
+
+    assert updated["cash"] == 1_000_000.0
+    assert updated["positions"]["net_oz"] == 75.0
+    assert "last_updated" in updated
+    assert json.loads(path.read_text(encoding="utf-8")) == updated
+    assert not list(path.parent.glob(".portfolio_state.*"))
+
+
+def test_failed_write_keeps_previous_state_and_cleans_temp_file(tmp_path, monkeypatch) -> None:
+    path = _mock_state_path(tmp_path)
+    monkeypatch.setattr(state, "_state_file_path", lambda: path)
+    state.update_portfolio_state({"positions": {"symbol": "XAUUSD", "net_oz": 10.0}})
+    before = path.read_bytes()
+
+    def fail_replace(src, dst) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(state.os, "replace", fail_replace)
+    with pytest.raises(OSError, match="disk full"):
+        portfolio.update_portfolio_state({"positions": {"symbol": "XAUUSD", "net_oz": 20.0}})
+
+    assert path.read_bytes() == before
+    assert not list(path.parent.glob(".portfolio_state.*"))